@@ -0,0 +1,163 @@
+"""Fake backends used by the benchmark suite
+
+Nothing here touches a real browser, window manager or screen: the fake
+pygetwindow/pyautogui modules are installed into sys.modules before the
+screenshot features are imported, and the stub driver replaces Firefox in
+the shared WebDriver pool.
+"""
+import asyncio
+import sys
+import time
+import types
+from typing import Dict, Any
+from PIL import Image, ImageDraw
+from features.base_feature import BaseFeature
+
+
+class FakeWindow:
+    def __init__(self, title: str, left: int = 0, top: int = 0, width: int = 1280, height: int = 720):
+        self.title = title
+        self.left = left
+        self.top = top
+        self.right = left + width
+        self.bottom = top + height
+
+
+class FakeScreen:
+    """Produces synthetic frames; every `change_every`-th frame differs from the previous one"""
+
+    def __init__(self, size=(1280, 720), change_every: int = 5):
+        self.size = size
+        self.change_every = change_every
+        self.frames = 0
+        self._frame = Image.new("RGB", size, "white")
+
+    def screenshot(self, region=None):
+        self.frames += 1
+        if self.frames % self.change_every == 0:
+            frame = self._frame.copy()
+            offset = (self.frames * 37) % (self.size[0] - 300)
+            ImageDraw.Draw(frame).rectangle((offset, 50, offset + 300, 350), fill=(self.frames * 53) % 256)
+            self._frame = frame
+        return self._frame.copy()
+
+
+def install_fake_gui_backends(window_titles=("Dashboard",), screen: FakeScreen = None) -> FakeScreen:
+    """Register fake pygetwindow and pyautogui modules"""
+    screen = screen or FakeScreen()
+    windows = [FakeWindow(title) for title in window_titles]
+
+    gw = types.ModuleType("pygetwindow")
+    gw.getAllWindows = lambda: list(windows)
+    gw.getWindowsWithTitle = lambda title: [w for w in windows if title in w.title]
+    sys.modules["pygetwindow"] = gw
+
+    pyautogui = types.ModuleType("pyautogui")
+    pyautogui.screenshot = screen.screenshot
+    sys.modules["pyautogui"] = pyautogui
+    return screen
+
+
+class _FakeElement:
+    def click(self):
+        pass
+
+    def send_keys(self, *args):
+        pass
+
+    def is_displayed(self):
+        return True
+
+
+class FakeDriver:
+    """Minimal stand-in for selenium's Firefox driver"""
+
+    def __init__(self, load_time: float = 0.0):
+        self.load_time = load_time
+        self.current_url = "about:blank"
+        self._png = None
+
+    def get(self, url: str):
+        time.sleep(self.load_time)
+        self.current_url = url
+
+    def find_element(self, by=None, value=None):
+        return _FakeElement()
+
+    def find_elements(self, by=None, value=None):
+        return [_FakeElement()]
+
+    def get_screenshot_as_png(self) -> bytes:
+        if self._png is None:
+            import io
+            buffer = io.BytesIO()
+            Image.new("RGB", (1280, 720), "white").save(buffer, "PNG")
+            self._png = buffer.getvalue()
+        return self._png
+
+    def quit(self):
+        pass
+
+
+class ChattyFeature(BaseFeature):
+    """Synthetic feature modelled on SlowTaskFeature, printing as fast as asked"""
+
+    @property
+    def name(self) -> str:
+        return "Chatty Task"
+
+    @property
+    def icon(self) -> str:
+        return "time"
+
+    def init(self) -> None:
+        self.lines = 1000
+        self.delay = 0.0
+
+    def main(self, **kwargs) -> None:
+        lines = int(kwargs.get('lines', self.lines))
+        delay = float(kwargs.get('delay', self.delay))
+        stop_event = kwargs.get('stop_event')
+
+        print("chatty-first")
+        for i in range(lines):
+            if stop_event and stop_event.is_set():
+                return
+            print(f"chatty line {i + 1}/{lines}")
+            self.progress(i + 1, lines)
+            if delay and stop_event is not None:
+                stop_event.wait(delay)
+
+    def exit(self) -> None:
+        pass
+
+    def options(self, parent) -> Dict[str, Any]:
+        return {"widget": None, "values": lambda: {"lines": self.lines, "delay": self.delay}}
+
+
+class AsyncMonitorFeature(BaseFeature):
+    """Synthetic async feature: a monitor that mostly waits"""
+
+    @property
+    def name(self) -> str:
+        return "Async Monitor"
+
+    @property
+    def icon(self) -> str:
+        return "time"
+
+    def init(self) -> None:
+        self.checks = 5
+        self.interval = 0.1
+
+    async def main(self, **kwargs) -> None:
+        checks = int(kwargs.get('checks', self.checks))
+        interval = float(kwargs.get('interval', self.interval))
+        for _ in range(checks):
+            await asyncio.sleep(interval)
+
+    def exit(self) -> None:
+        pass
+
+    def options(self, parent) -> Dict[str, Any]:
+        return {"widget": None, "values": lambda: {"checks": self.checks, "interval": self.interval}}
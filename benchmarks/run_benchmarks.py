@@ -0,0 +1,296 @@
+"""Headless benchmark suite for the task runner, terminal and capture paths
+
+Run from the repository root, under Xvfb on machines without a display:
+
+    xvfb-run -a python -m benchmarks.run_benchmarks --output bench.json
+    python -m benchmarks.run_benchmarks --compare previous.json
+
+Results are written as JSON so runs of different versions can be compared.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+# Fakes must be registered before any screenshot feature is imported
+from benchmarks.fakes import AsyncMonitorFeature, ChattyFeature, FakeDriver, FakeScreen, install_fake_gui_backends
+
+SCREEN = install_fake_gui_backends(("Dashboard",), FakeScreen())
+
+from config import Config  # noqa: E402
+from utils.feature_registry import FeatureRegistry  # noqa: E402
+
+
+def _summary(samples: List[float], unit: str) -> Dict[str, float]:
+    return {
+        "unit": unit,
+        "samples": len(samples),
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "max": max(samples),
+    }
+
+
+def _pump_until(root, condition: Callable[[], bool], timeout: float = 30.0) -> float:
+    """Run the Tk event loop until condition() holds; returns the time it took"""
+    start = time.perf_counter()
+    while not condition():
+        if time.perf_counter() - start > timeout:
+            raise TimeoutError("Condition not reached")
+        root.update()
+        time.sleep(0.0005)
+    return time.perf_counter() - start
+
+
+def bench_feature_load(repeat: int) -> Dict[str, dict]:
+    cold, warm = [], []
+    manifest_dir = tempfile.mkdtemp()
+    manifest = os.path.join(manifest_dir, "manifest.json")
+    try:
+        for _ in range(repeat):
+            if os.path.exists(manifest):
+                os.remove(manifest)
+            start = time.perf_counter()
+            FeatureRegistry("features", manifest_path=manifest).discover()
+            cold.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            FeatureRegistry("features", manifest_path=manifest).discover()
+            warm.append(time.perf_counter() - start)
+    finally:
+        shutil.rmtree(manifest_dir, ignore_errors=True)
+    return {
+        "feature_discovery_cold": _summary(cold, "s"),
+        "feature_discovery_cached": _summary(warm, "s"),
+    }
+
+
+def bench_terminal_throughput(root, lines: int) -> Dict[str, dict]:
+    from utils.terminal import Terminal
+
+    terminal = Terminal(root, queue_size=lines + 1)
+    terminal.pack()
+    try:
+        start = time.perf_counter()
+        for i in range(lines):
+            terminal.put(f"benchmark line {i}")
+        enqueue = time.perf_counter() - start
+        render = _pump_until(root, lambda: terminal.lines_rendered >= lines, timeout=120)
+        total = time.perf_counter() - start
+    finally:
+        terminal.stop()
+        terminal.destroy()
+    return {
+        "terminal_enqueue_rate": {"unit": "lines/s", "value": lines / enqueue},
+        "terminal_render_rate": {"unit": "lines/s", "value": lines / total},
+        "terminal_drain_time": {"unit": "s", "value": render},
+    }
+
+
+def _create_main_page(root):
+    from pages.main_page import MainPage
+
+    page = MainPage(root, Config.load_config(), lambda: None)
+    page.pack(fill="both", expand=True)
+    feature = ChattyFeature()
+    feature.init()
+    page.current_feature = feature
+    return page, feature
+
+
+def bench_task_runner(root, repeat: int) -> Dict[str, dict]:
+    page, feature = _create_main_page(root)
+    first_output, start_latency, stop_latency = [], [], []
+    try:
+        for _ in range(repeat):
+            # run_feature -> first line of feature output visible in the Terminal
+            page.current_options = {"values": lambda: {"lines": 0, "delay": 0.0}}
+            page.terminal.clear()
+            start = time.perf_counter()
+            page.run_feature()
+            _pump_until(root, lambda: bool(page.terminal.search("chatty-first", "1.0", "end")))
+            first_output.append(time.perf_counter() - start)
+
+            # Start (Queued -> Running) and stop (Stop click -> Stopped) latency
+            page.current_options = {"values": lambda: {"lines": 10 ** 6, "delay": 0.5}}
+            task_id = page.next_task_id
+            status = lambda: page.tasks[task_id].status
+            start = time.perf_counter()
+            page.run_feature()
+            _pump_until(root, lambda: status() == "Running")
+            start_latency.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            page.stop_task(task_id)
+            _pump_until(root, lambda: status() == "Stopped")
+            stop_latency.append(time.perf_counter() - start)
+    finally:
+        page.on_closing()
+        page.destroy()
+    return {
+        "run_to_first_output": _summary(first_output, "s"),
+        "task_start_latency": _summary(start_latency, "s"),
+        "task_stop_latency": _summary(stop_latency, "s"),
+    }
+
+
+def bench_screenshot_pipeline(frames: int, image_format: str) -> Dict[str, dict]:
+    from features.open_status import WindowCapture
+    from utils.frame_diff import FrameChangeDetector
+    from utils.screenshot_writer import ScreenshotWriter
+
+    output_dir = tempfile.mkdtemp()
+    results = {}
+    try:
+        for label, detector in (("all_frames", None), ("changed_frames", FrameChangeDetector())):
+            writer = ScreenshotWriter(image_format=image_format)
+            capture = WindowCapture("Dashboard", output_dir, writer, detector=detector)
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                for _ in range(frames):
+                    capture.take_screenshot()
+                captured = time.perf_counter() - start
+                writer.close()
+                total = time.perf_counter() - start
+            stats = writer.stats()
+            results[f"capture_rate_{label}"] = {"unit": "frames/s", "value": frames / captured}
+            results[f"pipeline_rate_{label}"] = {"unit": "frames/s", "value": frames / total}
+            results[f"bytes_written_{label}"] = {"unit": "bytes", "value": stats["bytes_written"]}
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+    return results
+
+
+def bench_url_capture(repeat: int) -> Dict[str, dict]:
+    try:
+        from features.get_status_screen import GetStatusScreenFeature
+    except ImportError as e:
+        return {"url_capture": {"skipped": f"selenium unavailable: {str(e)}"}}
+    from utils.screenshot_writer import ScreenshotWriter
+    from utils.webdriver_pool import firefox_pool
+
+    firefox_pool._create_driver = lambda: FakeDriver()
+    output_dir = tempfile.mkdtemp()
+    samples = []
+    try:
+        feature = GetStatusScreenFeature()
+        feature.init()
+        feature.output_dir = output_dir
+        writer = ScreenshotWriter(png_level=feature.png_level)
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(repeat):
+                start = time.perf_counter()
+                feature._capture("http://localhost/", 1, None, writer)
+                samples.append(time.perf_counter() - start)
+            writer.close()
+    finally:
+        firefox_pool.shutdown()
+        shutil.rmtree(output_dir, ignore_errors=True)
+    return {"url_capture_stub_driver": _summary(samples, "s")}
+
+
+def bench_async_runs(runs: int) -> Dict[str, dict]:
+    from utils.async_runner import AsyncRunner
+    from utils.cancellation import CancellationToken
+
+    feature = AsyncMonitorFeature()
+    feature.init()
+    runner = AsyncRunner()
+    done = threading.Semaphore(0)
+    threads = threading.active_count()
+    try:
+        start = time.perf_counter()
+        for _ in range(runs):
+            runner.submit(feature.main(), CancellationToken(), lambda error: done.release())
+        peak_threads = threading.active_count()
+        for _ in range(runs):
+            done.acquire()
+        elapsed = time.perf_counter() - start
+    finally:
+        runner.shutdown()
+    ideal = feature.checks * feature.interval
+    return {
+        "async_runs_wall_time": {"unit": "s", "value": elapsed, "runs": runs, "ideal": ideal},
+        "async_runs_extra_threads": {"unit": "threads", "value": peak_threads - threads},
+    }
+
+
+def compare(current: dict, previous: dict) -> None:
+    print(f"{'benchmark':<40} {'previous':>12} {'current':>12} {'change':>9}")
+    for name, result in current["results"].items():
+        old = previous.get("results", {}).get(name)
+        key = "median" if "median" in result else "value"
+        if not old or key not in old or key not in result:
+            continue
+        change = (result[key] - old[key]) / old[key] * 100 if old[key] else 0.0
+        print(f"{name:<40} {old[key]:>12.4g} {result[key]:>12.4g} {change:>8.1f}%")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default=None, help="JSON results file (default: benchmarks/results/...)")
+    parser.add_argument("--compare", default=None, help="previous results file to compare against")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--terminal-lines", type=int, default=20000)
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--image-format", default="png")
+    parser.add_argument("--async-runs", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    config = Config.load_config()
+    results = {}
+    results.update(bench_feature_load(args.repeat))
+    results.update(bench_screenshot_pipeline(args.frames, args.image_format))
+    results.update(bench_url_capture(args.repeat))
+    results.update(bench_async_runs(args.async_runs))
+
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        print("No DISPLAY: skipping Tk benchmarks (run under xvfb-run)")
+        results["tk"] = {"skipped": "no display"}
+    else:
+        import customtkinter as ctk
+        root = ctk.CTk()
+        stdout = sys.stdout
+        try:
+            results.update(bench_terminal_throughput(root, args.terminal_lines))
+            results.update(bench_task_runner(root, args.repeat))
+        finally:
+            sys.stdout = stdout
+            root.destroy()
+
+    report = {
+        "version": config.version,
+        "created_at": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+    output = args.output or os.path.join(
+        "benchmarks", "results", f"bench_{config.version}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    directory = os.path.dirname(output)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""Run features headless, without the customtkinter GUI
+
+    python cli.py list
+    python cli.py run "URL Status Screen" --set url=https://example.org --set wait_time=5
+    python cli.py run open_status --json '{"window_name": "Dashboard", "interval": 30, "occurrences": 10}'
+    python cli.py batch jobs.json
+
+A batch file is a JSON list of {"feature": ..., "options": {...}} objects; its
+jobs run concurrently. SIGINT/SIGTERM cancel every running task.
+"""
+import argparse
+import concurrent.futures
+import json
+import signal
+import sys
+import threading
+import time
+from typing import Any, Dict, List
+
+from config import Config
+from utils.async_runner import AsyncRunner
+from utils.cancellation import CancellationToken, TaskCancelled
+from utils.feature_registry import FeatureRegistry, LazyFeature
+from utils.history import TaskHistory
+from utils.logger import Logger
+from utils.metrics import MetricsExporter, TaskMetrics, activate
+
+
+def parse_value(raw: str) -> Any:
+    """Interpret option values as JSON when possible, else as plain strings"""
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return raw
+
+
+def find_feature(features: List[LazyFeature], key: str) -> LazyFeature:
+    for feature in features:
+        if key in (feature.name, feature.spec.module, feature.spec.class_name):
+            return feature
+    names = ", ".join(f'"{f.name}"' for f in features)
+    raise SystemExit(f"Unknown feature: {key} (available: {names})")
+
+
+class CliRunner:
+    def __init__(self, config: Config):
+        self.config = config
+        self.logger = Logger("CLI")
+        self.metrics_exporter = MetricsExporter()
+        self.history = TaskHistory(config.database)
+        self.stop_event = CancellationToken()
+        self._process_runner = None
+        self.async_runner = AsyncRunner()
+
+    def run_job(self, task_id: int, feature: LazyFeature, options: Dict[str, Any], results: Dict[int, str]):
+        task_metrics = TaskMetrics(task_id, feature.name)
+        status = "Error"
+        # Cancelled by a signal, or on the feature's own deadline
+        token = self.stop_event.child(timeout=feature.timeout)
+        try:
+            values = dict(options, stop_event=token)
+            try:
+                with activate(task_metrics), task_metrics.span("total"):
+                    print(f"[Task {task_id}] Starting {feature.name}")
+                    if feature.execution_mode == "process":
+                        self.process_runner.run(feature, values, token)
+                    elif feature.is_async:
+                        self.async_runner.submit(feature.main(**values), token, lambda error: None).result()
+                    else:
+                        feature.main(**values)
+            except (TaskCancelled, concurrent.futures.CancelledError):
+                pass
+            if token.reason == "deadline":
+                status = "Timed Out"
+            else:
+                status = "Stopped" if token.is_set() else "Completed"
+            print(f"[Task {task_id}] {status} {feature.name}")
+        except Exception as e:
+            error_msg = f"[Task {task_id}] Error in {feature.name}: {str(e)}"
+            print(error_msg)
+            self.logger.error(error_msg)
+        finally:
+            token.close()
+            task_metrics.finish()
+            results[task_id] = status
+            try:
+                self.metrics_exporter.export(task_metrics, status)
+            except OSError as e:
+                self.logger.warning(f"Could not export metrics for task {task_id}: {str(e)}")
+            self.history.record(
+                task_id,
+                feature.name,
+                options,
+                task_metrics.started_at,
+                time.time(),
+                status,
+                artifacts=task_metrics.artifacts
+            )
+
+    @property
+    def process_runner(self):
+        if self._process_runner is None:
+            from utils.process_runner import ProcessRunner
+            self._process_runner = ProcessRunner()
+        return self._process_runner
+
+    def run(self, jobs: List[tuple]) -> int:
+        """Run (feature, options) jobs concurrently; returns the process exit code"""
+        from utils.webdriver_pool import firefox_pool
+        firefox_pool.configure(
+            size=self.config.webdriver_pool_size,
+            headless=self.config.webdriver_headless,
+            max_uses=self.config.webdriver_max_uses,
+            idle_timeout=self.config.webdriver_idle_timeout,
+            prewarm=0
+        )
+
+        def request_stop(signum, _frame):
+            print(f"Received signal {signum}, stopping tasks...")
+            self.stop_event.cancel("signal")
+            for feature, _ in jobs:
+                if feature.loaded:
+                    feature.exit()
+
+        signal.signal(signal.SIGINT, request_stop)
+        if hasattr(signal, "SIGTERM"):
+            signal.signal(signal.SIGTERM, request_stop)
+
+        results: Dict[int, str] = {}
+        threads = [
+            threading.Thread(target=self.run_job, args=(task_id, feature, options, results), daemon=True)
+            for task_id, (feature, options) in enumerate(jobs, start=1)
+        ]
+        for thread in threads:
+            thread.start()
+        # Join with a timeout so signals are handled promptly in the main thread
+        for thread in threads:
+            while thread.is_alive():
+                thread.join(0.2)
+
+        firefox_pool.shutdown()
+        self.history.close()
+        if self._process_runner is not None:
+            self._process_runner.shutdown()
+        self.async_runner.shutdown()
+
+        if any(status in ("Error", "Timed Out") for status in results.values()):
+            return 1
+        if self.stop_event.is_set():
+            return 130
+        return 0
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list", help="list available features")
+
+    run_parser = subparsers.add_parser("run", help="run one feature")
+    run_parser.add_argument("feature", help="feature name, module or class name")
+    run_parser.add_argument("--set", action="append", default=[], metavar="KEY=VALUE",
+                            help="option value (JSON or plain string), repeatable")
+    run_parser.add_argument("--json", default=None, help="options as a JSON object")
+
+    batch_parser = subparsers.add_parser("batch", help="run several features concurrently")
+    batch_parser.add_argument("file", help='JSON list of {"feature": ..., "options": {...}}')
+
+    args = parser.parse_args(argv)
+    features = FeatureRegistry("features").discover()
+
+    if args.command == "list":
+        for feature in features:
+            print(f"{feature.name:<25} {feature.spec.module}.{feature.spec.class_name}")
+        return 0
+
+    if args.command == "run":
+        options = json.loads(args.json) if args.json else {}
+        for item in args.set:
+            key, sep, raw = item.partition("=")
+            if not sep:
+                raise SystemExit(f"Invalid --set value: {item} (expected KEY=VALUE)")
+            options[key] = parse_value(raw)
+        jobs = [(find_feature(features, args.feature), options)]
+    else:
+        with open(args.file, encoding="utf-8") as f:
+            spec = json.load(f)
+        jobs = [(find_feature(features, job["feature"]), job.get("options", {})) for job in spec]
+
+    return CliRunner(Config.load_config()).run(jobs)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,6 +14,19 @@ class Config:
     database: str
     debug: bool
     port: int
+    terminal_max_lines: int = 5000
+    terminal_max_bytes: int = 2 * 1024 * 1024
+    terminal_queue_size: int = 10000
+    terminal_overflow: Literal['drop_newest', 'drop_oldest'] = 'drop_newest'
+    max_workers: int = 4
+    webdriver_pool_size: int = 2
+    webdriver_headless: bool = False
+    webdriver_max_uses: int = 20
+    webdriver_idle_timeout: int = 300
+    webdriver_prewarm: int = 1
+    task_keep_last: int = 200
+    task_keep_minutes: float = 60
+    ui_refresh_rate: float = 10
     
     @classmethod
     def load_config(cls) -> 'Config':
@@ -27,5 +40,18 @@ class Config:
             theme=os.getenv('THEME', 'dark'),
             database=os.getenv('DATABASE', 'sqlite:///data.db'),
             debug=os.getenv('DEBUG', 'False').lower() == 'true',
-            port=int(os.getenv('PORT', '5000'))
+            port=int(os.getenv('PORT', '5000')),
+            terminal_max_lines=int(os.getenv('TERMINAL_MAX_LINES', '5000')),
+            terminal_max_bytes=int(os.getenv('TERMINAL_MAX_BYTES', str(2 * 1024 * 1024))),
+            terminal_queue_size=int(os.getenv('TERMINAL_QUEUE_SIZE', '10000')),
+            terminal_overflow=os.getenv('TERMINAL_OVERFLOW', 'drop_newest'),
+            max_workers=int(os.getenv('MAX_WORKERS', '4')),
+            webdriver_pool_size=int(os.getenv('WEBDRIVER_POOL_SIZE', '2')),
+            webdriver_headless=os.getenv('WEBDRIVER_HEADLESS', 'False').lower() == 'true',
+            webdriver_max_uses=int(os.getenv('WEBDRIVER_MAX_USES', '20')),
+            webdriver_idle_timeout=int(os.getenv('WEBDRIVER_IDLE_TIMEOUT', '300')),
+            webdriver_prewarm=int(os.getenv('WEBDRIVER_PREWARM', '1')),
+            task_keep_last=int(os.getenv('TASK_KEEP_LAST', '200')),
+            task_keep_minutes=float(os.getenv('TASK_KEEP_MINUTES', '60')),
+            ui_refresh_rate=float(os.getenv('UI_REFRESH_RATE', '10'))
         )
@@ -1,8 +1,21 @@
+import inspect
 from abc import ABC, abstractmethod
-from typing import Dict, Any
-import customtkinter as ctk
+from typing import Dict, Any, Optional, TYPE_CHECKING
+from utils import metrics, progress
+
+if TYPE_CHECKING:
+    import customtkinter as ctk
 
 class BaseFeature(ABC):
+    # Maximum number of concurrent runs of this feature (None = only the global limit)
+    max_concurrency: Optional[int] = None
+    # Run queue priority, lower runs first
+    priority: int = 0
+    # "thread" runs main() in the GUI process, "process" in a pooled worker process
+    execution_mode: str = "thread"
+    # Seconds after which a run is cancelled (None = no deadline)
+    timeout: Optional[float] = None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -21,7 +34,16 @@ class BaseFeature(ABC):
         
     @abstractmethod
     def main(self, **kwargs) -> None:
-        """Main feature execution"""
+        """Main feature execution
+
+        kwargs['stop_event'] is the run's CancellationToken: block on
+        stop_event.wait(seconds) instead of sleeping, and register cleanup
+        that interrupts blocking calls with utils.cancellation.on_cancel().
+
+        May be declared `async def`: the run is then an asyncio task on the
+        shared event loop, cancelled with the task when stopped. It must not
+        block; use asyncio.sleep() and awaitable I/O.
+        """
         pass
         
     @abstractmethod
@@ -29,7 +51,31 @@ class BaseFeature(ABC):
         """Cleanup"""
         pass
         
+    @property
+    def is_async(self) -> bool:
+        return inspect.iscoroutinefunction(self.main)
+
+    def span(self, name: str):
+        """Context manager timing a phase of the running task"""
+        return metrics.span(name)
+
+    def count(self, name: str, value: float = 1) -> None:
+        """Add to a counter of the running task"""
+        metrics.count(name, value)
+
+    def progress(self, current: float, total: Optional[float] = None, message: str = "") -> None:
+        """Report progress of the running task; cheap enough to call for every item"""
+        progress.report(current, total, message)
+
+    def add_artifact(self, path: str) -> None:
+        """Record a file produced by the running task in its history"""
+        metrics.artifact(path)
+
     @abstractmethod
-    def options(self, parent: ctk.CTkFrame) -> Dict[str, Any]:
-        """Return options widget and their values"""
+    def options(self, parent: "ctk.CTkFrame") -> Dict[str, Any]:
+        """Return options widget and their values
+
+        Import customtkinter here rather than at module level, so features
+        can be run headless from cli.py.
+        """
         pass
@@ -1,20 +1,30 @@
 from features.base_feature import BaseFeature
-import customtkinter as ctk
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import csv
+import itertools
 import threading
+import time
 import os
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.firefox.options import Options
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from utils.cancellation import TaskCancelled, on_cancel
+from utils.catalog import get_catalog
+from utils.screenshot_writer import FORMATS, ScreenshotWriter
+from utils.webdriver_pool import firefox_pool
 
-def click_pki(browser):
+if TYPE_CHECKING:
+    import customtkinter as ctk
+
+def click_pki(browser, timeout: int = 20):
     # connect_1_PKI
     # Wait for the PKI button to be present and click it
-    pki_button = WebDriverWait(browser, 20).until(
+    pki_button = WebDriverWait(browser, timeout).until(
         EC.presence_of_element_located((By.ID, "connect_1_PKI"))
     )
     pki_button.click()
@@ -35,6 +45,9 @@ def login(browser):
         print(f"Login error: {str(e)}")
 
 class GetStatusScreenFeature(BaseFeature):
+    # Each run drives its own Firefox instance
+    max_concurrency = 2
+
     @property
     def name(self) -> str:
         return "URL Status Screen"
@@ -46,64 +59,199 @@ class GetStatusScreenFeature(BaseFeature):
     def init(self) -> None:
         self.url = "https://de.www.mgmt.cloud.vmware.com/automation/#/service/catalog/consume/deployment/f75b95b1-9f41-4702-9a53-5fdc9089c64a"
         self.wait_time = 10  # seconds
+        # Browsers used in parallel in batch mode; None uses the whole pool
+        # (WEBDRIVER_POOL_SIZE), more than that would only wait for a session
+        self.concurrency = None
+        self.image_format = "png"
+        self.png_level = None  # PNG compression level 0-9, None keeps the browser's PNG as is
+        self.quality = 85  # WebP/JPEG quality
         self.output_dir = "share/screen_shots"
 
         # Create output directory if it doesn't exist
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
 
+        # Start browser sessions in the background before the first run
+        firefox_pool.prewarm()
+
     def main(self, **kwargs) -> None:
         url = kwargs.get('url', self.url)
         wait_time = int(kwargs.get('wait_time', self.wait_time))
         stop_event: threading.Event = kwargs.get('stop_event')
+        urls = self._batch_urls(kwargs.get('urls'), kwargs.get('url_file'))
+        writer = ScreenshotWriter(
+            image_format=kwargs.get('image_format', self.image_format),
+            png_level=self._png_level(kwargs.get('png_level', self.png_level)),
+            quality=int(kwargs.get('quality', self.quality)),
+            catalog=get_catalog(self.output_dir)
+        )
 
-        print(f"Opening URL: {url}")
         try:
-            # Configure Firefox options
-            firefox_options = Options()
-            #firefox_options.add_argument("--headless")  # Run in headless mode
-
-            # Initialize driver
-            driver = webdriver.Firefox(options=firefox_options)
+            if urls:
+                concurrency = int(kwargs.get('concurrency') or self.concurrency or firefox_pool.size)
+                self._run_batch(urls, wait_time, concurrency, stop_event, writer)
+                return
 
+            print(f"Opening URL: {url}")
             try:
-                # Load page
-                print("Loading page...")
-                driver.get(url)
-
-                # Wait for page to load
-                print(f"Waiting {wait_time} seconds for page to load...")
-                WebDriverWait(driver, wait_time).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+                result = self._capture(url, wait_time, stop_event, writer)
+                if result["status"] == "stopped":
+                    print("Task stopped by user")
+            except Exception as e:
+                print(f"Error: {str(e)}")
+                raise
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _png_level(value) -> Optional[int]:
+        # Re-encoding costs CPU per capture: only done when a level is chosen
+        if value is None or str(value).strip() == "":
+            return None
+        return int(value)
+
+    @staticmethod
+    def _batch_urls(urls, url_file) -> List[str]:
+        collected = [u.strip() for u in (urls or []) if u.strip()]
+        if url_file:
+            with open(url_file, encoding="utf-8") as f:
+                collected.extend(
+                    line.strip() for line in f
+                    if line.strip() and not line.strip().startswith("#")
                 )
+        return collected
+
+    def _capture(self, url: str, wait_time: int, stop_event: threading.Event,
+                 writer: ScreenshotWriter, suffix: str = "") -> Dict[str, Any]:
+        """Load a URL in a pooled browser and save a screenshot"""
+        start = time.monotonic()
+        try:
+            with self.span("driver.acquire"):
+                session = firefox_pool.acquire(stop_event=stop_event)
+        except TaskCancelled:
+            return {"url": url, "load_time": time.monotonic() - start, "screenshot": "", "status": "stopped"}
+        if stop_event and stop_event.is_set():
+            # Stopped while the session was starting: give it back, it is healthy
+            firefox_pool.release(session)
+            return {"url": url, "load_time": time.monotonic() - start, "screenshot": "", "status": "stopped"}
+        interrupted = False
 
-                # Login
+        def interrupt():
+            # Stop clicked: quitting the browser aborts the pending page load or wait.
+            # Runs on the thread that cancels (often the UI), so the quit is not awaited
+            nonlocal interrupted
+            interrupted = True
+            firefox_pool.interrupt(session)
+
+        try:
+            with on_cancel(stop_event, interrupt):
+                result = self._load_and_capture(session, url, wait_time, stop_event, writer, suffix, start)
+        except BaseException as e:
+            firefox_pool.release(session, broken=True)
+            if interrupted and isinstance(e, Exception):
+                print(f"Capture of {url} interrupted")
+                return {"url": url, "load_time": time.monotonic() - start, "screenshot": "", "status": "stopped"}
+            raise
+        firefox_pool.release(session, broken=interrupted)
+        return result
+
+    def _load_and_capture(self, session, url: str, wait_time: int, stop_event: threading.Event,
+                          writer: ScreenshotWriter, suffix: str, start: float) -> Dict[str, Any]:
+        driver = session.driver
+        if session.uses:
+            self.count("sessions.reused")
+            print(f"Reusing browser session ({session.uses} previous runs)")
+        else:
+            self.count("sessions.started")
+
+        # Load page
+        print(f"Loading page {url}...")
+        with self.span("driver.get"):
+            driver.get(url)
+
+        # Wait for page to load
+        print(f"Waiting {wait_time} seconds for page to load...")
+        with self.span("wait.body"):
+            WebDriverWait(driver, wait_time).until(
+                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            )
+
+        # Login (a warm session is usually already authenticated)
+        with self.span("click_pki"):
+            if session.uses:
+                try:
+                    click_pki(driver, timeout=2)
+                except TimeoutException:
+                    pass
+            else:
                 click_pki(driver)
+        load_time = time.monotonic() - start
 
-                if stop_event and stop_event.is_set():
-                    print("Task stopped by user")
-                    return
+        if stop_event and stop_event.is_set():
+            return {"url": url, "load_time": load_time, "screenshot": "", "status": "stopped"}
+
+        # Take screenshot
+        filename = get_catalog(self.output_dir).new_name(suffix=suffix)
+
+        print("Taking screenshot...")
+        # PNG bytes are encoded/written off the task thread
+        with self.span("save_screenshot"):
+            filepath = writer.submit(
+                driver.get_screenshot_as_png(), os.path.join(self.output_dir, filename), source=url
+            ) or ""
 
-                # Take screenshot
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"screenshot_{timestamp}.png"
-                filepath = os.path.join(self.output_dir, filename)
+        return {"url": url, "load_time": load_time, "screenshot": filepath, "status": "ok"}
 
-                print("Taking screenshot...")
-                driver.save_screenshot(filepath)
-                print(f"Screenshot saved: {filepath}")
+    def _run_batch(self, urls: List[str], wait_time: int, concurrency: int,
+                   stop_event: threading.Event, writer: ScreenshotWriter) -> None:
+        """Capture every URL concurrently, at most `concurrency` browsers at a time"""
+        if concurrency > firefox_pool.size:
+            print(f"Concurrency limited to {firefox_pool.size} by the browser pool size")
+        print(f"Batch capture of {len(urls)} URLs (concurrency {concurrency})")
 
+        done = itertools.count(1)
+
+        def capture(index: int, url: str) -> Dict[str, Any]:
+            if stop_event and stop_event.is_set():
+                return {"url": url, "load_time": 0.0, "screenshot": "", "status": "skipped"}
+            try:
+                return self._capture(url, wait_time, stop_event, writer, suffix=f"_{index:03d}")
+            except Exception as e:
+                print(f"Error capturing {url}: {str(e)}")
+                return {"url": url, "load_time": 0.0, "screenshot": "", "status": f"error: {str(e)}"}
             finally:
-                driver.quit()
+                self.progress(next(done), len(urls), url)
 
-        except Exception as e:
-            print(f"Error: {str(e)}")
-            raise
+        start = time.monotonic()
+        # Each item runs in a copy of this context so spans reach the task's metrics
+        contexts = [contextvars.copy_context() for _ in urls]
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+            results = list(pool.map(lambda ctx, i, u: ctx.run(capture, i, u), contexts, range(len(urls)), urls))
+        writer.flush()
+        elapsed = time.monotonic() - start
+
+        summary_path = os.path.join(
+            self.output_dir, f"batch_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        )
+        with open(summary_path, "w", newline="", encoding="utf-8") as f:
+            summary = csv.DictWriter(f, fieldnames=["url", "load_time", "screenshot", "status"])
+            summary.writeheader()
+            for result in results:
+                summary.writerow({**result, "load_time": f"{result['load_time']:.2f}"})
+
+        for result in results:
+            print(f"{result['status']:<8} {result['load_time']:6.2f}s  {result['url']}")
+        failed = [r for r in results if r["status"].startswith("error")]
+        print(f"Batch finished in {elapsed:.2f}s, {len(failed)} failed. Summary: {summary_path}")
+        if failed:
+            raise RuntimeError(f"{len(failed)} of {len(urls)} captures failed")
 
     def exit(self) -> None:
         pass
 
-    def options(self, parent: ctk.CTkFrame) -> Dict[str, Any]:
+    def options(self, parent: "ctk.CTkFrame") -> Dict[str, Any]:
+        import customtkinter as ctk
+
         frame = ctk.CTkFrame(parent)
 
         # URL input
@@ -122,6 +270,51 @@ class GetStatusScreenFeature(BaseFeature):
         wait_entry.insert(0, str(self.wait_time))
         wait_entry.pack(pady=5)
 
+        # Batch URLs input
+        batch_label = ctk.CTkLabel(frame, text="Batch URLs (one per line, overrides URL):")
+        batch_label.pack(pady=5)
+
+        batch_text = ctk.CTkTextbox(frame, width=300, height=80)
+        batch_text.pack(pady=5)
+
+        file_label = ctk.CTkLabel(frame, text="Batch URL file (optional):")
+        file_label.pack(pady=5)
+
+        file_entry = ctk.CTkEntry(frame, width=300)
+        file_entry.pack(pady=5)
+
+        concurrency_label = ctk.CTkLabel(
+            frame, text=f"Batch concurrency (at most {firefox_pool.size}, the browser pool size):"
+        )
+        concurrency_label.pack(pady=5)
+
+        concurrency_entry = ctk.CTkEntry(frame)
+        concurrency_entry.insert(0, str(self.concurrency or firefox_pool.size))
+        concurrency_entry.pack(pady=5)
+
+        # Image format
+        format_label = ctk.CTkLabel(frame, text="Image format:")
+        format_label.pack(pady=5)
+
+        format_combobox = ctk.CTkComboBox(frame, values=list(FORMATS))
+        format_combobox.set(self.image_format)
+        format_combobox.pack(pady=5)
+
+        png_level_label = ctk.CTkLabel(frame, text="PNG compression level (0-9, empty keeps the browser's PNG):")
+        png_level_label.pack(pady=5)
+
+        png_level_entry = ctk.CTkEntry(frame)
+        if self.png_level is not None:
+            png_level_entry.insert(0, str(self.png_level))
+        png_level_entry.pack(pady=5)
+
+        quality_label = ctk.CTkLabel(frame, text="Quality (WebP/JPEG):")
+        quality_label.pack(pady=5)
+
+        quality_entry = ctk.CTkEntry(frame)
+        quality_entry.insert(0, str(self.quality))
+        quality_entry.pack(pady=5)
+
         # Output directory label
         output_label = ctk.CTkLabel(
             frame,
@@ -134,6 +327,12 @@ class GetStatusScreenFeature(BaseFeature):
             "widget": frame,
             "values": lambda: {
                 "url": url_entry.get(),
-                "wait_time": int(wait_entry.get())
+                "wait_time": int(wait_entry.get()),
+                "urls": batch_text.get("1.0", "end").splitlines(),
+                "url_file": file_entry.get().strip(),
+                "concurrency": int(concurrency_entry.get()),
+                "image_format": format_combobox.get(),
+                "png_level": self._png_level(png_level_entry.get()),
+                "quality": int(quality_entry.get())
             }
         }
@@ -1,12 +1,78 @@
 import os
 import threading
-from datetime import datetime
-from typing import Dict, Any
-import customtkinter as ctk
+from typing import Dict, Any, Optional, TYPE_CHECKING
 from features.base_feature import BaseFeature
 from PIL import ImageGrab
 import pygetwindow as gw
 import pyautogui
+from utils import metrics
+from utils.cancellation import CancellationToken
+from utils.catalog import ScreenshotCatalog, get_catalog
+from utils.frame_diff import FrameChangeDetector
+from utils.periodic import PeriodicScheduler
+from utils.screenshot_writer import FORMATS, ScreenshotWriter
+from utils.window_poller import WindowPoller
+
+if TYPE_CHECKING:
+    import customtkinter as ctk
+
+class WindowCapture:
+    """Screenshots of one window, caching its handle until it stops resolving"""
+
+    def __init__(self, window_name: str, output_dir: str, writer: ScreenshotWriter,
+                 detector: Optional[FrameChangeDetector] = None, save_region: bool = False,
+                 catalog: Optional[ScreenshotCatalog] = None):
+        self.window_name = window_name
+        self.output_dir = output_dir
+        self.writer = writer
+        self.catalog = catalog or get_catalog(output_dir)
+        self.detector = detector
+        self.save_region = save_region
+        self.unchanged = 0
+        self._window = None
+
+    def _bbox(self):
+        if self._window is not None:
+            try:
+                window = self._window
+                return (window.left, window.top, window.right, window.bottom)
+            except Exception:
+                self._window = None
+
+        windows = gw.getWindowsWithTitle(self.window_name)
+        if not windows:
+            return None
+        self._window = windows[0]
+        window = self._window
+        return (window.left, window.top, window.right, window.bottom)
+
+    def take_screenshot(self):
+        with metrics.span("window.resolve"):
+            bbox = self._bbox()
+        if bbox:
+            with metrics.span("screenshot"):
+                screenshot = pyautogui.screenshot(region=bbox)
+            filename = self.catalog.new_name()
+
+            if self.detector:
+                with metrics.span("change_detection"):
+                    change = self.detector.check(screenshot)
+                if not change.changed:
+                    self.unchanged += 1
+                    metrics.count("frames.unchanged")
+                    print(f"Window unchanged (score {change.score:.2f}), screenshot skipped")
+                    return
+                full_frame = change.bbox == (0, 0, screenshot.width, screenshot.height)
+                if self.save_region and not full_frame:
+                    left, top, right, bottom = change.bbox
+                    screenshot = screenshot.crop(change.bbox)
+                    filename = self.catalog.new_name(suffix=f"_region_{left}_{top}_{right}_{bottom}")
+
+            # Encoding and writing happen on the writer's workers
+            self.writer.submit(screenshot, os.path.join(self.output_dir, filename), source=self.window_name)
+        else:
+            print(f"Window '{self.window_name}' not found.")
+
 
 class GetStatusScreenFeature(BaseFeature):
     @property
@@ -22,49 +88,78 @@ class GetStatusScreenFeature(BaseFeature):
         self.output_dir = "share/screen_shots"
         self.interval = 60  # seconds for periodic screenshots
         self.occurrences = 1  # number of times to take screenshots
-        self.stop_event = threading.Event()
+        self.only_changes = False  # skip frames identical to the previous one
+        self.change_threshold = 1.0  # mean pixel difference in percent
+        self.save_region = False  # store only the changed region
+        self.image_format = "png"
+        self.png_level = 6  # PNG compression level, 0-9
+        self.quality = 85  # WebP/JPEG quality
+        self._schedulers = set()
+        self._lock = threading.Lock()
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
 
     def main(self, **kwargs) -> None:
         window_name = kwargs.get('window_name', self.window_name)
-        self.interval = int(kwargs.get('interval', self.interval))
-        self.occurrences = int(kwargs.get('occurrences', self.occurrences))
-        self.stop_event = kwargs.get('stop_event', threading.Event())
+        self.interval = interval = int(kwargs.get('interval', self.interval))
+        self.occurrences = occurrences = int(kwargs.get('occurrences', self.occurrences))
+        stop_event = kwargs.get('stop_event') or CancellationToken()
         if not window_name:
             print("No window selected.")
             return
         print(f"Capturing screenshots from window: {window_name}")
+
+        detector = None
+        if kwargs.get('only_changes', self.only_changes):
+            detector = FrameChangeDetector(
+                threshold=float(kwargs.get('change_threshold', self.change_threshold))
+            )
+        catalog = get_catalog(self.output_dir)
+        writer = ScreenshotWriter(
+            image_format=kwargs.get('image_format', self.image_format),
+            png_level=int(kwargs.get('png_level', self.png_level)),
+            quality=int(kwargs.get('quality', self.quality)),
+            catalog=catalog
+        )
+        capture = WindowCapture(
+            window_name,
+            self.output_dir,
+            writer,
+            detector=detector,
+            save_region=bool(kwargs.get('save_region', self.save_region)),
+            catalog=catalog
+        )
+        def tick():
+            capture.take_screenshot()
+            self.progress(scheduler.runs + 1, occurrences)
+
+        scheduler = PeriodicScheduler(interval, occurrences, tick, stop_event)
+        with self._lock:
+            self._schedulers.add(scheduler)
         try:
-            self._take_screenshot_periodically(window_name, self.occurrences)
+            scheduler.run()
         except Exception as e:
             print(f"Error: {str(e)}")
             raise
-
-    def _take_screenshot(self, window_name):
-        window = gw.getWindowsWithTitle(window_name)
-        if window:
-            window = window[0]
-            bbox = (window.left, window.top, window.right, window.bottom)
-            screenshot = pyautogui.screenshot(region=bbox)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"screenshot_{timestamp}.png"
-            filepath = os.path.join(self.output_dir, filename)
-            screenshot.save(filepath)
-            print(f"Screenshot saved: {filepath}")
-        else:
-            print(f"Window '{window_name}' not found.")
-
-    def _take_screenshot_periodically(self, window_name, occurrences):
-        if not self.stop_event.is_set() and occurrences > 0:
-            self._take_screenshot(window_name)
-            occurrences -= 1
-            threading.Timer(self.interval, self._take_screenshot_periodically, [window_name, occurrences]).start()
+        finally:
+            with self._lock:
+                self._schedulers.discard(scheduler)
+            writer.close()
+            stats = scheduler.stats()
+            print(
+                f"Captures: {stats['runs']}, missed deadlines: {stats['missed']}, "
+                f"jitter avg {stats['avg_jitter'] * 1000:.1f} ms / max {stats['max_jitter'] * 1000:.1f} ms, "
+                f"unchanged frames skipped: {capture.unchanged}"
+            )
 
     def exit(self) -> None:
-        self.stop_event.set()
+        with self._lock:
+            for scheduler in self._schedulers:
+                scheduler.stop()
+
+    def options(self, parent: "ctk.CTkFrame") -> Dict[str, Any]:
+        import customtkinter as ctk
 
-    def options(self, parent: ctk.CTkFrame) -> Dict[str, Any]:
         frame = ctk.CTkFrame(parent)
         
         window_label = ctk.CTkLabel(frame, text="Select Window:")
@@ -85,6 +180,36 @@ class GetStatusScreenFeature(BaseFeature):
         occurrences_entry.insert(0, str(self.occurrences))
         occurrences_entry.pack(pady=5)
         
+        only_changes_var = ctk.BooleanVar(value=self.only_changes)
+        ctk.CTkCheckBox(frame, text="Only save when the window changed", variable=only_changes_var).pack(pady=5)
+
+        threshold_label = ctk.CTkLabel(frame, text="Change threshold (% mean difference):")
+        threshold_label.pack(pady=5)
+        threshold_entry = ctk.CTkEntry(frame)
+        threshold_entry.insert(0, str(self.change_threshold))
+        threshold_entry.pack(pady=5)
+
+        save_region_var = ctk.BooleanVar(value=self.save_region)
+        ctk.CTkCheckBox(frame, text="Store only the changed region", variable=save_region_var).pack(pady=5)
+
+        format_label = ctk.CTkLabel(frame, text="Image format:")
+        format_label.pack(pady=5)
+        format_combobox = ctk.CTkComboBox(frame, values=list(FORMATS))
+        format_combobox.set(self.image_format)
+        format_combobox.pack(pady=5)
+
+        png_level_label = ctk.CTkLabel(frame, text="PNG compression level (0-9):")
+        png_level_label.pack(pady=5)
+        png_level_entry = ctk.CTkEntry(frame)
+        png_level_entry.insert(0, str(self.png_level))
+        png_level_entry.pack(pady=5)
+
+        quality_label = ctk.CTkLabel(frame, text="Quality (WebP/JPEG):")
+        quality_label.pack(pady=5)
+        quality_entry = ctk.CTkEntry(frame)
+        quality_entry.insert(0, str(self.quality))
+        quality_entry.pack(pady=5)
+
         output_label = ctk.CTkLabel(
             frame,
             text=f"Screenshots will be saved in: {self.output_dir}",
@@ -92,14 +217,21 @@ class GetStatusScreenFeature(BaseFeature):
         )
         output_label.pack(pady=10)
         
-        self._update_window_list()
+        poller = WindowPoller(frame, self._get_open_windows, self._update_window_list)
+        poller.start()
         
         return {
             "widget": frame,
             "values": lambda: {
                 "window_name": self.window_combobox.get(),
                 "interval": int(interval_entry.get()),
-                "occurrences": int(occurrences_entry.get())
+                "occurrences": int(occurrences_entry.get()),
+                "only_changes": only_changes_var.get(),
+                "change_threshold": float(threshold_entry.get()),
+                "save_region": save_region_var.get(),
+                "image_format": format_combobox.get(),
+                "png_level": int(png_level_entry.get()),
+                "quality": int(quality_entry.get())
             }
         }
 
@@ -107,7 +239,6 @@ class GetStatusScreenFeature(BaseFeature):
         windows = [window.title for window in gw.getAllWindows() if window.title]
         return windows
 
-    def _update_window_list(self):
-        windows = self._get_open_windows()
-        self.window_combobox.configure(values=windows)
-        self.window_combobox.after(1000, self._update_window_list)
+    def _update_window_list(self, windows):
+        if self.window_combobox.winfo_exists():
+            self.window_combobox.configure(values=windows)
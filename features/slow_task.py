@@ -1,9 +1,10 @@
 # features/slow_task.py
-import time
 from features.base_feature import BaseFeature
-import customtkinter as ctk
-from typing import Dict, Any
-import threading
+from typing import Dict, Any, TYPE_CHECKING
+from utils.cancellation import CancellationToken
+
+if TYPE_CHECKING:
+    import customtkinter as ctk
 
 class SlowTaskFeature(BaseFeature):
     @property
@@ -21,21 +22,23 @@ class SlowTaskFeature(BaseFeature):
     def main(self, **kwargs) -> None:
         iterations = int(kwargs.get('iterations', self.iterations))
         delay = float(kwargs.get('delay', self.delay))
-        stop_event: threading.Event = kwargs.get('stop_event')
+        stop_event = kwargs.get('stop_event') or CancellationToken()
         
         for i in range(iterations):
-            if stop_event and stop_event.is_set():
+            if stop_event.is_set():
                 return
                 
             print(f"Step {i+1}/{iterations}")
+            self.progress(i, iterations, f"Step {i+1}")
             
-            # Check for stop during sleep
-            for _ in range(int(delay * 10)):
-                if stop_event and stop_event.is_set():
-                    return
-                time.sleep(0.1)
+            # Sleep until the next step, waking up only if the task is stopped
+            if stop_event.wait(delay):
+                return
+        self.progress(iterations, iterations)
     
-    def options(self, parent: ctk.CTkFrame) -> Dict[str, Any]:
+    def options(self, parent: "ctk.CTkFrame") -> Dict[str, Any]:
+        import customtkinter as ctk
+
         frame = ctk.CTkFrame(parent)
         
         ctk.CTkLabel(frame, text="Iterations:").pack(pady=5)
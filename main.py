@@ -1,8 +1,11 @@
+import argparse
+import sys
+import time
 import customtkinter as ctk
 from config import Config
 from pages.login_page import LoginPage
-from pages.main_page import MainPage
 from utils.logger import Logger
+from utils.startup import ImportWarmer, report_startup_profile
 
 class App(ctk.CTk):
     def __init__(self):
@@ -33,6 +36,12 @@ class App(ctk.CTk):
         # Initialize pages
         self.current_page = None
         self.show_login_page()
+        self.protocol("WM_DELETE_WINDOW", self.on_closing)
+
+        # The main page and features are imported while the user logs in,
+        # once the login page has been drawn
+        self.warmer = ImportWarmer()
+        self.after_idle(self.warmer.start)
         
     def show_login_page(self):
         self.logger.info("Switching to login page")
@@ -45,11 +54,33 @@ class App(ctk.CTk):
         self.logger.info("Switching to main page")
         if self.current_page:
             self.current_page.destroy()
+        start = time.perf_counter()
+        preloaded = "pages.main_page" in sys.modules
+        # Usually already imported by the warmer, otherwise waits for it to finish
+        from pages.main_page import MainPage
+        if not preloaded:
+            self.logger.info(f"Waited {time.perf_counter() - start:.2f}s for the main page imports")
         self.current_page = MainPage(self, self.config, self.show_login_page)
         self.current_page.pack(fill="both", expand=True)
 
+    def on_closing(self):
+        self.logger.info("Closing application")
+        if hasattr(self.current_page, "on_closing"):
+            self.current_page.on_closing()
+        self.destroy()
+
 
 def main():
+    parser = argparse.ArgumentParser(description="Start the application")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="report the import time of each module at startup instead of starting")
+    parser.add_argument("--top", type=int, default=25, help="modules listed per startup phase")
+    parser.add_argument("--profile-output", default=None, help="also write the startup profile as JSON")
+    args = parser.parse_args()
+    if args.profile_startup:
+        report_startup_profile(args.top, args.profile_output)
+        return
+
     logger = Logger("Main")
     try:
         logger.info("Application startup")
@@ -0,0 +1,123 @@
+import customtkinter as ctk
+import os
+import tkinter as tk
+from datetime import datetime
+from typing import Dict, Optional
+from PIL import Image
+from utils.catalog import ScreenshotCatalog, ThumbnailCache
+
+ALL_FEATURES = "All features"
+
+
+class GalleryWindow(ctk.CTkToplevel):
+    """Captures of the catalog, one page of thumbnails at a time
+
+    Only the visible page is queried from the index and only its thumbnails
+    are requested, so the gallery stays fast with thousands of captures.
+    """
+
+    def __init__(self, parent, catalog: ScreenshotCatalog, thumbnails: ThumbnailCache,
+                 columns: int = 5, rows: int = 4):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.thumbnails = thumbnails
+        self.columns = columns
+        self.page_size = columns * rows
+        self.offset = 0
+        self.total = 0
+        self.tiles: Dict[str, ctk.CTkLabel] = {}
+        self.title("Screenshots")
+        self.geometry("980x640")
+
+        # Navigation
+        self.nav_frame = ctk.CTkFrame(self)
+        self.nav_frame.pack(fill="x", padx=10, pady=10)
+
+        self.feature_var = ctk.StringVar(value=ALL_FEATURES)
+        self.feature_menu = ctk.CTkOptionMenu(
+            self.nav_frame,
+            values=[ALL_FEATURES] + catalog.features(),
+            variable=self.feature_var,
+            command=lambda _: self.show_page(0, force=True)
+        )
+        self.feature_menu.pack(side="left", padx=5)
+
+        self.next_button = ctk.CTkButton(self.nav_frame, text="Older", width=80,
+                                         command=lambda: self.show_page(self.offset + self.page_size))
+        self.next_button.pack(side="right", padx=5)
+        self.page_label = ctk.CTkLabel(self.nav_frame, text="")
+        self.page_label.pack(side="right", padx=10)
+        self.prev_button = ctk.CTkButton(self.nav_frame, text="Newer", width=80,
+                                         command=lambda: self.show_page(self.offset - self.page_size))
+        self.prev_button.pack(side="right", padx=5)
+
+        # Thumbnails grid
+        self.grid_frame = ctk.CTkFrame(self)
+        self.grid_frame.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        self.bind("<MouseWheel>", self._on_wheel)
+        self.bind("<Button-4>", lambda _: self.show_page(self.offset - self.page_size))
+        self.bind("<Button-5>", lambda _: self.show_page(self.offset + self.page_size))
+
+        self.show_page(0)
+
+    @property
+    def feature(self) -> Optional[str]:
+        feature = self.feature_var.get()
+        return None if feature == ALL_FEATURES else feature
+
+    def show_page(self, offset: int, force: bool = False):
+        self.total = self.catalog.count(self.feature)
+        offset = max(0, min(offset, max(0, self.total - 1) // self.page_size * self.page_size))
+        if offset == self.offset and self.tiles and not force:
+            return
+        self.offset = offset
+
+        # Thumbnails of the previous page are no longer needed
+        self.thumbnails.clear_pending()
+        for widget in self.grid_frame.winfo_children():
+            widget.destroy()
+        self.tiles.clear()
+
+        for index, row in enumerate(self.catalog.page(offset, self.page_size, self.feature)):
+            self._add_tile(index, row)
+
+        pages = max(1, (self.total + self.page_size - 1) // self.page_size)
+        self.page_label.configure(text=f"Page {offset // self.page_size + 1}/{pages} · {self.total} captures")
+        self.prev_button.configure(state="normal" if offset > 0 else "disabled")
+        self.next_button.configure(state="normal" if offset + self.page_size < self.total else "disabled")
+
+    def _add_tile(self, index: int, row):
+        created = datetime.fromtimestamp(row["created_at"]).strftime("%Y-%m-%d %H:%M:%S")
+        source = row["source"] or os.path.basename(row["path"])
+        tile = ctk.CTkLabel(
+            self.grid_frame,
+            text=f"{created}\n{source[:28]}\n{row['width']}x{row['height']}",
+            compound="top",
+            width=self.thumbnails.size[0] + 20,
+            height=self.thumbnails.size[1] + 60
+        )
+        tile.grid(row=index // self.columns, column=index % self.columns, padx=4, pady=4)
+        self.tiles[row["path"]] = tile
+
+        image = self.thumbnails.request(row["path"], row["sha1"], self._on_thumbnail)
+        if image is not None:
+            self._show_thumbnail(row["path"], image)
+
+    def _on_thumbnail(self, path: str, image: Image.Image):
+        # Called from the thumbnail worker
+        try:
+            self.after(0, lambda: self._show_thumbnail(path, image))
+        except (RuntimeError, tk.TclError):
+            pass
+
+    def _show_thumbnail(self, path: str, image: Image.Image):
+        tile = self.tiles.get(path)
+        if tile is None or not tile.winfo_exists():
+            return
+        thumbnail = ctk.CTkImage(light_image=image, dark_image=image, size=image.size)
+        tile.configure(image=thumbnail)
+        tile.image = thumbnail  # Keep reference
+
+    def _on_wheel(self, event):
+        step = -self.page_size if event.delta > 0 else self.page_size
+        self.show_page(self.offset + step)
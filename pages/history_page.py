@@ -0,0 +1,80 @@
+import customtkinter as ctk
+import json
+from datetime import datetime
+from typing import List
+from utils.history import TaskHistory
+from utils.task_store import FAILED_STATUSES
+
+ALL_FEATURES = "All features"
+
+
+class HistoryWindow(ctk.CTkToplevel):
+    """Past task runs: last N runs of a feature, or failures of the last 24h"""
+
+    def __init__(self, parent, history: TaskHistory, features: List[str], limit: int = 50):
+        super().__init__(parent)
+        self.history = history
+        self.limit = limit
+        self.title("Task History")
+        self.geometry("900x500")
+
+        # Filters
+        self.filters_frame = ctk.CTkFrame(self)
+        self.filters_frame.pack(fill="x", padx=10, pady=10)
+
+        self.feature_var = ctk.StringVar(value=ALL_FEATURES)
+        self.feature_menu = ctk.CTkOptionMenu(
+            self.filters_frame,
+            values=[ALL_FEATURES] + sorted(features),
+            variable=self.feature_var,
+            command=lambda _: self.refresh()
+        )
+        self.feature_menu.pack(side="left", padx=5)
+
+        self.failures_var = ctk.BooleanVar(value=False)
+        self.failures_check = ctk.CTkCheckBox(
+            self.filters_frame,
+            text="Failures (last 24h)",
+            variable=self.failures_var,
+            command=self.refresh
+        )
+        self.failures_check.pack(side="left", padx=5)
+
+        self.refresh_button = ctk.CTkButton(
+            self.filters_frame,
+            text="Refresh",
+            command=self.refresh,
+            width=80
+        )
+        self.refresh_button.pack(side="right", padx=5)
+
+        # Runs
+        self.runs_text = ctk.CTkTextbox(self, font=("Courier", 12), wrap="none")
+        self.runs_text.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+
+        self.refresh()
+
+    def refresh(self):
+        if self.failures_var.get():
+            rows = self.history.failures(hours=24, limit=self.limit)
+        else:
+            feature = self.feature_var.get()
+            rows = self.history.last_runs(None if feature == ALL_FEATURES else feature, self.limit)
+
+        lines = [f"{'Started':<20} {'Task':>5}  {'Feature':<22} {'Status':<10} {'Duration':>9}  Artifacts"]
+        for row in rows:
+            started = datetime.fromtimestamp(row["started_at"]).strftime("%Y-%m-%d %H:%M:%S")
+            artifacts = json.loads(row["artifacts"] or "[]")
+            lines.append(
+                f"{started:<20} {row['task_id']:>5}  {row['feature'][:22]:<22} {row['status']:<10} "
+                f"{row['duration'] or 0:>8.1f}s  {len(artifacts)}"
+            )
+            if row["status"] in FAILED_STATUSES and row["output"]:
+                lines.append(f"    {row['output'].splitlines()[-1]}")
+        if not rows:
+            lines.append("No runs recorded")
+
+        self.runs_text.configure(state="normal")
+        self.runs_text.delete("1.0", "end")
+        self.runs_text.insert("end", "\n".join(lines))
+        self.runs_text.configure(state="disabled")
@@ -1,37 +1,34 @@
 import customtkinter as ctk
-from typing import Callable, Dict
-import importlib
-import os
-import inspect
+from typing import Callable, Dict, Optional
 import sys
-import threading
 import queue
+import time
 from features.base_feature import BaseFeature
+from pages.gallery_page import GalleryWindow
+from pages.history_page import HistoryWindow
+from pages.task_list import TaskList
+from utils.animation import animation_clock
+from utils.async_runner import AsyncRunner
+from utils.cancellation import CancellationToken, TaskCancelled
+from utils.catalog import DEFAULT_DIRECTORY, ThumbnailCache, get_catalog
+from utils.feature_registry import FeatureRegistry
+from utils.history import TaskHistory
 from utils.logger import Logger
-from utils.terminal import Terminal, TerminalOutput
+from utils.metrics import MetricsExporter, TaskMetrics, activate
+from utils.process_runner import ProcessRunner
+from utils import progress
+from utils.progress import TaskUpdates
+from utils.task_executor import TaskExecutor
+from utils.task_store import TaskStore
+from utils.terminal import Terminal, TerminalOutput, task_output
+from utils.webdriver_pool import firefox_pool
+from utils.icons import icon_cache
 import tkinter as tk
-from PIL import Image, ImageTk
-import qtawesome as qta
 
 class FeatureButton(ctk.CTkButton):
     def __init__(self, parent, feature: BaseFeature, command: Callable):
         # Create icon
-        try:
-            if feature.icon.startswith('fa'):
-                # QtAwesome icon
-                qta_icon = qta.icon(feature.icon, color='white')
-                icon = ImageTk.PhotoImage(qta_icon.to_image(32, 32))
-            else:
-                # Custom image icon
-                icon_path = os.path.join('icons', f"{feature.icon}.png")
-                if os.path.exists(icon_path):
-                    img = Image.open(icon_path)
-                    img = img.resize((24, 24), Image.Resampling.LANCZOS)
-                    icon = ImageTk.PhotoImage(img)
-                else:
-                    icon = None
-        except Exception:
-            icon = None
+        icon = icon_cache.get(feature.icon, 32 if feature.icon.startswith('fa') else 24)
 
         super().__init__(
             parent,
@@ -45,69 +42,6 @@ class FeatureButton(ctk.CTkButton):
         # Keep a reference to prevent garbage collection
         self.icon = icon
 
-class TaskFrame(ctk.CTkFrame):
-    def __init__(self, parent, task_id: int, name: str, icon: str, stop_callback: Callable):
-        super().__init__(parent)
-        self.task_id = task_id
-        
-        # Task info
-        self.info_frame = ctk.CTkFrame(self)
-        self.info_frame.pack(side="left", fill="x", expand=True)
-        
-        # Try to create icon
-        try:
-            if icon.startswith('fa'):
-                qta_icon = qta.icon(icon, color='white')
-                task_icon = ImageTk.PhotoImage(qta_icon.to_image(24, 24))
-            else:
-                icon_path = os.path.join('icons', f"{icon}.png")
-                if os.path.exists(icon_path):
-                    img = Image.open(icon_path)
-                    img = img.resize((20, 20), Image.Resampling.LANCZOS)
-                    task_icon = ImageTk.PhotoImage(img)
-                else:
-                    task_icon = None
-        except Exception:
-            task_icon = None
-        
-        # Icon label if icon exists
-        if task_icon:
-            self.icon_label = ctk.CTkLabel(
-                self.info_frame,
-                text="",
-                image=task_icon
-            )
-            self.icon_label.pack(side="left", padx=5)
-            self.icon_label.image = task_icon  # Keep reference
-        
-        self.name_label = ctk.CTkLabel(
-            self.info_frame,
-            text=f"Task {task_id}: {name}",
-            anchor="w"
-        )
-        self.name_label.pack(side="left", padx=5)
-        
-        self.status_label = ctk.CTkLabel(
-            self.info_frame,
-            text="Running",
-            text_color="yellow"
-        )
-        self.status_label.pack(side="left", padx=5)
-        
-        # Stop button
-        self.stop_button = ctk.CTkButton(
-            self,
-            text="Stop",
-            command=lambda: stop_callback(task_id),
-            width=60,
-            fg_color="#DC2626",
-            hover_color="#B91C1C"
-        )
-        self.stop_button.pack(side="right", padx=5, pady=2)
-    
-    def update_status(self, status: str, color: str):
-        self.status_label.configure(text=status, text_color=color)
-
 class MainPage(ctk.CTkFrame):
     def __init__(self, parent, config, logout_callback: Callable):
         super().__init__(parent)
@@ -120,10 +54,34 @@ class MainPage(ctk.CTkFrame):
         self.current_options = None
         
         # Task management
-        self.tasks = {}
+        self.tasks = TaskStore(
+            keep_last=self.config.task_keep_last,
+            keep_minutes=self.config.task_keep_minutes
+        )
         self.next_task_id = 1
+        self.executor = TaskExecutor(max_workers=self.config.max_workers)
+        self.process_runner = ProcessRunner()
+        self.async_runner = AsyncRunner()
+        self.metrics_exporter = MetricsExporter()
+        self.history = TaskHistory(self.config.database)
+        self.history_window = None
+        self.gallery_window = None
+        self.thumbnails = None
+        firefox_pool.configure(
+            size=self.config.webdriver_pool_size,
+            headless=self.config.webdriver_headless,
+            max_uses=self.config.webdriver_max_uses,
+            idle_timeout=self.config.webdriver_idle_timeout,
+            prewarm=self.config.webdriver_prewarm
+        )
+        
+        self._durations_animation = None
+        # Status and progress posted by task threads, applied at a fixed rate
+        self.updates = TaskUpdates()
+        self._updates_animation = None
         
         self.init_ui()
+        self._update_task_counters()
         self.load_features()
 
     def init_ui(self):
@@ -168,8 +126,13 @@ class MainPage(ctk.CTkFrame):
         )
         self.tasks_label.pack(pady=2)
         
-        # Tasks list
-        self.tasks_list = ctk.CTkScrollableFrame(self.tasks_frame, height=100)
+        # Tasks list (only the visible rows are widgets)
+        self.tasks_list = TaskList(
+            self.tasks_frame,
+            self.tasks,
+            self.stop_task,
+            output_callback=self.show_task_output
+        )
         self.tasks_list.pack(fill="x", expand=True, padx=5, pady=5)
         
         # Terminal frame
@@ -185,11 +148,21 @@ class MainPage(ctk.CTkFrame):
         self.terminal_label.pack(pady=2)
         
         # Terminal
-        self.terminal = Terminal(self.terminal_frame, height=100)
+        self.terminal = Terminal(
+            self.terminal_frame,
+            height=100,
+            max_lines=self.config.terminal_max_lines,
+            max_bytes=self.config.terminal_max_bytes,
+            queue_size=self.config.terminal_queue_size,
+            overflow=self.config.terminal_overflow
+        )
         self.terminal.pack(fill="both", expand=True, padx=5, pady=5)
         
         # Redirect stdout to terminal
-        sys.stdout = TerminalOutput(self.terminal)
+        self.terminal_output = TerminalOutput(self.terminal)
+        sys.stdout = self.terminal_output
+        if self.config.debug:
+            self.after(5000, self._log_terminal_stats)
         
         # Buttons frame
         self.buttons_frame = ctk.CTkFrame(self.right_panel)
@@ -203,6 +176,16 @@ class MainPage(ctk.CTkFrame):
         )
         self.run_button.pack(side="left", padx=5)
         
+        # Show all output button
+        self.all_output_button = ctk.CTkButton(
+            self.buttons_frame,
+            text="All Output",
+            command=lambda: self.show_task_output(None),
+            fg_color="#555555",
+            hover_color="#666666"
+        )
+        self.all_output_button.pack(side="left", padx=5)
+        
         # Clear terminal button
         self.clear_button = ctk.CTkButton(
             self.buttons_frame,
@@ -212,38 +195,55 @@ class MainPage(ctk.CTkFrame):
             hover_color="#666666"
         )
         self.clear_button.pack(side="left", padx=5)
+        
+        # Task history button
+        self.history_button = ctk.CTkButton(
+            self.buttons_frame,
+            text="History",
+            command=self.show_history,
+            fg_color="#555555",
+            hover_color="#666666"
+        )
+        self.history_button.pack(side="left", padx=5)
+        
+        # Screenshots gallery button
+        self.gallery_button = ctk.CTkButton(
+            self.buttons_frame,
+            text="Screenshots",
+            command=self.show_gallery,
+            fg_color="#555555",
+            hover_color="#666666"
+        )
+        self.gallery_button.pack(side="left", padx=5)
+
+    def _log_terminal_stats(self):
+        stats = self.terminal.stats()
+        self.logger.debug(
+            f"Terminal: {stats['lines_per_sec']} lines/s, "
+            f"queue depth {stats['queue_depth']}, "
+            f"{stats['lines_rendered']} lines rendered, "
+            f"{stats['dropped_lines']} dropped, "
+            f"{stats['spilled_lines']} spilled to disk"
+        )
+        if self.terminal.running:
+            self.after(5000, self._log_terminal_stats)
 
     def load_features(self):
-        features_dir = "features"
         self.logger.info("Loading features...")
-        
-        for file in os.listdir(features_dir):
-            if file.endswith(".py") and file not in ["__init__.py", "base_feature.py"]:
-                module_name = file[:-3]
-                try:
-                    module = importlib.import_module(f"features.{module_name}")
-                    
-                    for name, obj in inspect.getmembers(module):
-                        if (inspect.isclass(obj) and 
-                            issubclass(obj, BaseFeature) and 
-                            obj != BaseFeature):
-                            
-                            feature = obj()
-                            feature.init()
-                            self.features[feature.name] = feature
-                            
-                            # Create feature button with icon
-                            btn = FeatureButton(
-                                self.features_frame,
-                                feature,
-                                lambda f=feature: self.select_feature(f)
-                            )
-                            btn.pack(pady=5, padx=10, fill="x")
-                            
-                            self.logger.info(f"Loaded feature: {feature.name}")
-                            
-                except Exception as e:
-                    self.logger.error(f"Error loading feature {module_name}: {str(e)}")
+
+        # Modules are only imported when a feature is first selected or run
+        for feature in FeatureRegistry("features").discover():
+            self.features[feature.name] = feature
+
+            # Create feature button with icon
+            btn = FeatureButton(
+                self.features_frame,
+                feature,
+                lambda f=feature: self.select_feature(f)
+            )
+            btn.pack(pady=5, padx=10, fill="x")
+
+            self.logger.info(f"Discovered feature: {feature.name}")
 
     def select_feature(self, feature: BaseFeature):
         self.current_feature = feature
@@ -251,7 +251,14 @@ class MainPage(ctk.CTkFrame):
         for widget in self.options_frame.winfo_children():
             widget.destroy()
         
-        options = feature.options(self.options_frame)
+        try:
+            options = feature.options(self.options_frame)
+        except Exception as e:
+            self.current_options = None
+            error_msg = f"Error loading feature {feature.name}: {str(e)}"
+            print(error_msg)
+            self.logger.error(error_msg)
+            return
         self.current_options = options
         options["widget"].pack(fill="both", expand=True, pady=10)
         
@@ -265,78 +272,250 @@ class MainPage(ctk.CTkFrame):
                 task_id = self.next_task_id
                 self.next_task_id += 1
                 
-                # Create stop event
-                stop_event = threading.Event()
-                
-                # Create task frame with icon
-                task_frame = TaskFrame(
-                    self.tasks_list,
-                    task_id,
-                    self.current_feature.name,
-                    self.current_feature.icon,
-                    self.stop_task
-                )
-                task_frame.pack(fill="x", padx=5, pady=2)
+                feature = self.current_feature
                 
+                # Cancellation token; the feature's deadline starts with the run
+                stop_event = CancellationToken()
+
                 # Store task info
-                self.tasks[task_id] = {
-                    'frame': task_frame,
-                    'stop_event': stop_event,
-                    'feature': self.current_feature.name
-                }
+                self.tasks.add(task_id, feature.name, feature.icon, stop_event)
+                self.tasks.prune()
+                self.tasks_list.scroll_to(0)
+                self._update_task_counters()
+                self._animate_durations()
+                self._animate_updates()
                 
                 # Add stop_event to values
                 values['stop_event'] = stop_event
                 
-                # Start thread
-                thread = threading.Thread(
-                    target=self._run_task,
-                    args=(task_id, self.current_feature, values),
-                    daemon=True
+                if feature.is_async:
+                    self._run_async_task(task_id, feature, values)
+                    print(f"Started task {task_id}: {feature.name}")
+                    return
+                
+                # Queue the run; it starts once a worker and the feature limit allow it
+                self.executor.set_feature_limit(feature.name, feature.max_concurrency)
+                self.executor.submit(
+                    task_id,
+                    feature.name,
+                    lambda: self._run_task(task_id, feature, values),
+                    priority=feature.priority,
+                    on_start=lambda: self.updates.post_status(task_id, "Running", "yellow")
                 )
-                thread.start()
                 
-                print(f"Started task {task_id}: {self.current_feature.name}")
+                print(f"Queued task {task_id}: {feature.name}")
                 
             except Exception as e:
                 error_msg = f"Error starting feature: {str(e)}"
                 print(error_msg)
                 self.logger.error(error_msg)
 
+    def _begin_task(self, task_id: int, feature: BaseFeature, values: dict) -> TaskMetrics:
+        task_metrics = TaskMetrics(task_id, feature.name)
+        record = self.tasks.get(task_id)
+        if record is not None:
+            record.metrics = task_metrics
+        if feature.timeout:
+            values['stop_event'].set_deadline(feature.timeout)
+        self.terminal_output.start_capture(task_id)
+        return task_metrics
+
     def _run_task(self, task_id: int, feature: BaseFeature, values: dict):
+        task_metrics = self._begin_task(task_id, feature, values)
+        error = None
         try:
-            print(f"[Task {task_id}] Starting {feature.name}")
-            feature.main(**values)
-            
-            if task_id in self.tasks:
-                if self.tasks[task_id]['stop_event'].is_set():
-                    print(f"[Task {task_id}] Stopped {feature.name}")
-                    self.after(0, lambda: self._update_task_status(task_id, "Stopped", "gray"))
+            with task_output(task_id), activate(task_metrics), progress.activate(self.updates.reporter(task_id)), \
+                    task_metrics.span("total"):
+                print(f"[Task {task_id}] Starting {feature.name}")
+                if feature.execution_mode == "process":
+                    self.process_runner.run(feature, values, values['stop_event'])
                 else:
-                    print(f"[Task {task_id}] Completed {feature.name}")
-                    self.after(0, lambda: self._update_task_status(task_id, "Completed", "green"))
-                    
+                    feature.main(**values)
+        except TaskCancelled:
+            pass
         except Exception as e:
-            error_msg = f"[Task {task_id}] Error in {feature.name}: {str(e)}"
-            print(error_msg)
-            self.logger.error(error_msg)
-            self.after(0, lambda: self._update_task_status(task_id, "Error", "red"))
+            error = e
+        self._finish_task(task_id, feature, values, task_metrics, error)
+
+    def _run_async_task(self, task_id: int, feature: BaseFeature, values: dict):
+        """Schedule an `async def main` on the shared event loop, without a worker thread"""
+        task_metrics = self._begin_task(task_id, feature, values)
+        self.updates.post_status(task_id, "Running", "yellow")
+
+        async def run():
+            # Each asyncio task has its own context: output and metrics stay per run
+            with task_output(task_id), activate(task_metrics), progress.activate(self.updates.reporter(task_id)), \
+                    task_metrics.span("total"):
+                print(f"[Task {task_id}] Starting {feature.name}")
+                try:
+                    await feature.main(**values)
+                except TaskCancelled:
+                    pass
+
+        self.async_runner.submit(
+            run(),
+            values['stop_event'],
+            lambda error: self._finish_task(task_id, feature, values, task_metrics, error),
+            key=feature.name,
+            limit=feature.max_concurrency
+        )
+
+    def _finish_task(self, task_id: int, feature: BaseFeature, values: dict,
+                     task_metrics: TaskMetrics, error: Optional[BaseException]):
+        """Status, metrics and history of a finished run; called from a worker thread"""
+        status = "Error"
+        try:
+            # The final status line belongs to the task's output and its recorded capture
+            with task_output(task_id):
+                if error is None:
+                    status = self._end_status(task_id, feature, values['stop_event'])
+                else:
+                    error_msg = f"[Task {task_id}] Error in {feature.name}: {str(error)}"
+                    print(error_msg)
+                    self.logger.error(error_msg)
+                    self.updates.post_status(task_id, "Error", "red")
+        finally:
+            values['stop_event'].close()
+            self.terminal.close_channel(task_id)
+            task_metrics.finish()
+            try:
+                self.metrics_exporter.export(task_metrics, status)
+            except OSError as e:
+                self.logger.warning(f"Could not export metrics for task {task_id}: {str(e)}")
+            self.history.record(
+                task_id,
+                feature.name,
+                values,
+                task_metrics.started_at,
+                time.time(),
+                status,
+                artifacts=task_metrics.artifacts,
+                output=self.terminal_output.stop_capture(task_id)
+            )
+
+    def _end_status(self, task_id: int, feature: BaseFeature, stop_event: CancellationToken) -> str:
+        if stop_event.is_set() and stop_event.reason == "deadline":
+            status, color = "Timed Out", "orange"
+            print(f"[Task {task_id}] Timed out after {feature.timeout}s: {feature.name}")
+        elif stop_event.is_set():
+            status, color = "Stopped", "gray"
+            print(f"[Task {task_id}] Stopped {feature.name}")
+        else:
+            status, color = "Completed", "green"
+            print(f"[Task {task_id}] Completed {feature.name}")
+        self.updates.post_status(task_id, status, color)
+        return status
 
     def stop_task(self, task_id: int):
-        if task_id in self.tasks:
+        record = self.tasks.get(task_id)
+        if record is not None and record.active:
+            if self.executor.cancel(task_id):
+                record.stop_event.close()
+                print(f"Cancelled queued task {task_id}")
+                self._update_task_status(task_id, "Cancelled", "gray")
+                return
             print(f"Stopping task {task_id}...")
-            self.tasks[task_id]['stop_event'].set()
+            # Applied right away on the Tk thread; a final status posted meanwhile still wins
             self._update_task_status(task_id, "Stopping", "orange")
+            # Wakes the task's waits and runs its cancel callbacks right away
+            record.stop_event.cancel()
 
     def _update_task_status(self, task_id: int, status: str, color: str):
-        if task_id in self.tasks:
-            self.tasks[task_id]['frame'].update_status(status, color)
+        record = self.tasks.set_status(task_id, status, color)
+        if record is None:
+            return
+        self.tasks_list.update_task(task_id)
+        if not record.active:
+            self.updates.forget(task_id)
+            self.tasks.prune()
+            self.tasks_list.refresh_if_changed()
+            self._update_task_counters()
+
+    def _animate_updates(self):
+        if self._updates_animation is None:
+            self._updates_animation = animation_clock.register(
+                self, self._apply_updates, interval=1 / self.config.ui_refresh_rate
+            )
+
+    def _apply_updates(self) -> bool:
+        """Apply the latest status and progress of each task, once per refresh"""
+        statuses, latest = self.updates.drain()
+        for task_id, value in latest.items():
+            record = self.tasks.get(task_id)
+            if record is not None:
+                record.progress = value
+                self.tasks_list.update_progress(task_id)
+        for task_id, (status, color) in statuses.items():
+            self._update_task_status(task_id, status, color)
+        if self.tasks.running == 0 and not self.updates.pending:
+            self._updates_animation = None
+            return False
+        return True
+
+    def _update_task_counters(self):
+        counters = self.tasks.counters()
+        self.tasks_label.configure(
+            text=f"Tasks · {counters['running']} running · {counters['completed']} completed · "
+                 f"{counters['failed']} failed · {counters['total']} total"
+        )
+
+    def show_task_output(self, task_id: Optional[int]):
+        self.terminal.show_task(task_id)
+        if task_id is None:
+            self.terminal_label.configure(text="Output")
+        else:
+            self.terminal_label.configure(text=f"Output - Task {task_id}")
+
+    def show_history(self):
+        if self.history_window is not None and self.history_window.winfo_exists():
+            self.history_window.refresh()
+            self.history_window.focus()
+            return
+        self.history_window = HistoryWindow(self, self.history, list(self.features))
+
+    def show_gallery(self):
+        if self.gallery_window is not None and self.gallery_window.winfo_exists():
+            self.gallery_window.show_page(0, force=True)
+            self.gallery_window.focus()
+            return
+        if self.thumbnails is None:
+            self.thumbnails = ThumbnailCache(DEFAULT_DIRECTORY)
+        self.gallery_window = GalleryWindow(self, get_catalog(DEFAULT_DIRECTORY), self.thumbnails)
+
+    def _animate_durations(self):
+        if self._durations_animation is None:
+            self._durations_animation = animation_clock.register(self, self._refresh_durations, interval=0.5)
+
+    def _refresh_durations(self) -> bool:
+        """Show elapsed time and the current phase of the visible tasks"""
+        # Finished tasks also expire with time
+        if self.tasks.prune():
+            self.tasks_list.refresh()
+        settled = True
+        for row in self.tasks_list.visible_rows():
+            row.refresh_duration()
+            task_metrics = row.record.metrics
+            settled = settled and (task_metrics is None or task_metrics.finished)
+        # Stop animating once the last run has finished and shown its final time
+        if self.tasks.running == 0 and settled:
+            self._durations_animation = None
+            return False
+        return True
 
     def on_closing(self):
         """Called when application closes"""
         # Stop all running tasks
-        for task_id in list(self.tasks.keys()):
+        for task_id in self.tasks.active_ids():
             self.stop_task(task_id)
+        animation_clock.unregister(self._durations_animation)
+        animation_clock.unregister(self._updates_animation)
+        self.executor.shutdown()
+        self.process_runner.shutdown()
+        self.async_runner.shutdown()
+        firefox_pool.shutdown()
+        self.history.close()
+        if self.thumbnails is not None:
+            self.thumbnails.close()
         
         self.terminal.stop()
         sys.stdout = sys.__stdout__
@@ -0,0 +1,209 @@
+import customtkinter as ctk
+from typing import Callable, List, Optional
+from utils.icons import icon_cache
+from utils.progress import Progress, format_eta
+from utils.spinner import Spinner
+from utils.task_store import TaskRecord, TaskStore
+
+
+class TaskFrame(ctk.CTkFrame):
+    """One row of the task list, re-bound to whichever record is shown in it"""
+
+    def __init__(self, parent, stop_callback: Callable, output_callback: Optional[Callable] = None):
+        super().__init__(parent)
+        self.task_id: Optional[int] = None
+        self.record: Optional[TaskRecord] = None
+        self.stop_callback = stop_callback
+        self.output_callback = output_callback
+        self._icon_name = None
+
+        # Task info
+        self.info_frame = ctk.CTkFrame(self)
+        self.info_frame.pack(side="left", fill="x", expand=True)
+
+        self.icon_label = ctk.CTkLabel(self.info_frame, text="", width=24)
+        self.icon_label.pack(side="left", padx=5)
+
+        self.spinner = Spinner(self.info_frame, font=("Courier", 14), width=16)
+        self.spinner.pack(side="left")
+
+        self.name_label = ctk.CTkLabel(self.info_frame, text="", anchor="w")
+        self.name_label.pack(side="left", padx=5)
+
+        self.status_label = ctk.CTkLabel(self.info_frame, text="")
+        self.status_label.pack(side="left", padx=5)
+
+        self.duration_label = ctk.CTkLabel(self.info_frame, text="", text_color="gray")
+        self.duration_label.pack(side="left", padx=5)
+
+        # Progress, packed once the task reports some
+        self.progress_bar = ctk.CTkProgressBar(self.info_frame, width=120)
+        self.progress_label = ctk.CTkLabel(self.info_frame, text="", text_color="gray")
+
+        # Stop button
+        self.stop_button = ctk.CTkButton(
+            self,
+            text="Stop",
+            command=lambda: self.task_id is not None and stop_callback(self.task_id),
+            width=60,
+            fg_color="#DC2626",
+            hover_color="#B91C1C"
+        )
+        self.stop_button.pack(side="right", padx=5, pady=2)
+
+        # Show only this task's output in the terminal
+        if output_callback:
+            self.output_button = ctk.CTkButton(
+                self,
+                text="Output",
+                command=lambda: self.task_id is not None and output_callback(self.task_id),
+                width=60,
+                fg_color="#555555",
+                hover_color="#666666"
+            )
+            self.output_button.pack(side="right", padx=5, pady=2)
+
+    def show(self, record: TaskRecord):
+        """Display `record` in this row"""
+        if record is not self.record:
+            self.record = record
+            self.task_id = record.task_id
+            self.name_label.configure(text=f"Task {record.task_id}: {record.feature}")
+            if record.icon != self._icon_name:
+                self._icon_name = record.icon
+                task_icon = icon_cache.get(record.icon, 24 if record.icon.startswith('fa') else 20)
+                self.icon_label.configure(image=task_icon)
+                self.icon_label.image = task_icon  # Keep reference
+            self.refresh_duration()
+            self.update_progress(record.progress)
+        self.update_status(record.status, record.color)
+
+    def update_status(self, status: str, color: str):
+        self.status_label.configure(text=status, text_color=color)
+        if self.record is not None and self.record.active:
+            self.spinner.start()
+        else:
+            self.spinner.stop()
+
+    def update_progress(self, progress: Optional[Progress]):
+        if progress is None:
+            self.progress_bar.pack_forget()
+            self.progress_label.pack_forget()
+            return
+        if not self.progress_label.winfo_manager():
+            self.progress_label.pack(side="left", padx=5)
+        fraction = progress.fraction
+        if fraction is None:
+            self.progress_bar.pack_forget()
+            text = f"{progress.current:g}"
+        else:
+            self.progress_bar.set(fraction)
+            if not self.progress_bar.winfo_manager():
+                self.progress_bar.pack(side="left", padx=5, before=self.progress_label)
+            text = f"{progress.current:g}/{progress.total:g}"
+            if self.record is not None and self.record.active:
+                text += f" {format_eta(progress.eta())}"
+        if progress.message:
+            text += f" · {progress.message}"
+        self.progress_label.configure(text=text.strip())
+
+    def update_duration(self, text: str):
+        self.duration_label.configure(text=text)
+
+    def refresh_duration(self):
+        """Elapsed time and current phase of the bound task"""
+        task_metrics = self.record.metrics if self.record is not None else None
+        if task_metrics is None:
+            self.update_duration("")
+            return
+        text = f"{task_metrics.elapsed:.1f}s"
+        phase = task_metrics.current_phase()
+        if phase and phase[0] != "total":
+            text += f" · {phase[0]} {phase[1]:.1f}s"
+        self.update_duration(text)
+
+
+class TaskList(ctk.CTkFrame):
+    """Virtualized list of task records: only `visible_rows` TaskFrames ever exist
+
+    Scrolling re-binds the existing rows to other records, so the widget count
+    and the cost of a refresh do not grow with the number of tasks.
+    """
+
+    def __init__(self, parent, store: TaskStore, stop_callback: Callable,
+                 output_callback: Optional[Callable] = None, visible_rows: int = 4):
+        super().__init__(parent)
+        self.store = store
+        self.offset = 0
+        self._version = -1
+
+        self.rows_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.rows_frame.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.rows: List[TaskFrame] = []
+        for _ in range(visible_rows):
+            row = TaskFrame(self.rows_frame, stop_callback, output_callback)
+            self.rows.append(row)
+
+        wheel_targets = [self, self.rows_frame]
+        for row in self.rows:
+            wheel_targets += [row, row.info_frame, row.name_label, row.status_label, row.duration_label]
+        for widget in wheel_targets:
+            widget.bind("<MouseWheel>", self._on_wheel)
+            widget.bind("<Button-4>", lambda _: self.scroll_to(self.offset - 1))
+            widget.bind("<Button-5>", lambda _: self.scroll_to(self.offset + 1))
+
+    def refresh(self):
+        """Re-bind the visible rows after records were added, removed or scrolled"""
+        count = len(self.store)
+        self.offset = max(0, min(self.offset, count - len(self.rows)))
+        records = self.store.rows(self.offset, len(self.rows))
+        for row, record in zip(self.rows, records):
+            row.show(record)
+            if not row.winfo_manager():
+                row.pack(fill="x", padx=5, pady=2)
+        for row in self.rows[len(records):]:
+            row.record = row.task_id = None
+            row.spinner.stop()
+            row.pack_forget()
+        self._version = self.store.version
+
+        if count <= len(self.rows):
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.offset / count, (self.offset + len(self.rows)) / count)
+
+    def refresh_if_changed(self):
+        if self._version != self.store.version:
+            self.refresh()
+
+    def update_task(self, task_id: int):
+        """Refresh one record's status, if it is on screen"""
+        for row in self.rows:
+            if row.task_id == task_id:
+                row.show(self.store[task_id])
+
+    def update_progress(self, task_id: int):
+        """Show a record's latest progress, if it is on screen"""
+        for row in self.rows:
+            if row.task_id == task_id:
+                row.update_progress(self.store[task_id].progress)
+
+    def visible_rows(self) -> List[TaskFrame]:
+        return [row for row in self.rows if row.record is not None]
+
+    def scroll_to(self, offset: int):
+        self.offset = offset
+        self.refresh()
+
+    def _on_wheel(self, event):
+        self.scroll_to(self.offset + (-1 if event.delta > 0 else 1))
+
+    def _on_scrollbar(self, *args):
+        count = len(self.store)
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * count))
+        elif args[0] == "scroll":
+            self.scroll_to(self.offset + int(args[1]) * (len(self.rows) if args[2] == "pages" else 1))
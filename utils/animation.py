@@ -0,0 +1,107 @@
+import itertools
+import math
+import time
+import tkinter as tk
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional
+from utils.logger import Logger
+
+
+@dataclass
+class _Animation:
+    owner: tk.Misc
+    callback: Callable[[], Optional[bool]]
+    interval: float
+    next_due: float
+
+
+class AnimationClock:
+    """One Tk after() loop driving every animated widget of the process
+
+    Spinners, elapsed-time labels and progress bars register a callback with
+    their own interval; each tick calls the ones that are due, then sleeps
+    until the next one. Deadlines fall on multiples of the interval from one
+    epoch, so animations sharing an interval are due in the same tick however
+    far apart they were registered. With nothing registered no after() is pending.
+    Callbacks run on the Tk main thread, and register() must be called from it.
+    """
+
+    def __init__(self, min_delay: float = 0.01):
+        self.min_delay = min_delay
+        self.ticks = 0
+        self.logger = Logger("AnimationClock")
+        self._animations: Dict[int, _Animation] = {}
+        self._ids = itertools.count(1)
+        self._epoch = time.monotonic()
+        self._root: Optional[tk.Misc] = None
+        self._after_id = None
+
+    def register(self, owner: tk.Misc, callback: Callable[[], Optional[bool]], interval: float = 0.1) -> int:
+        """Call `callback` every `interval` seconds while `owner` exists
+
+        The animation ends when the callback returns False or unregister() is called.
+        """
+        root = owner.nametowidget(".")
+        if root is not self._root:
+            self._root = root
+            self._after_id = None
+        handle = next(self._ids)
+        self._animations[handle] = _Animation(owner, callback, interval, self._next_slot(interval, inclusive=True))
+        self._reschedule()
+        return handle
+
+    def _next_slot(self, interval: float, inclusive: bool = False) -> float:
+        """First multiple of `interval` from the epoch after now (or at now when `inclusive`)"""
+        steps = (time.monotonic() - self._epoch) / interval
+        return self._epoch + (math.ceil(steps) if inclusive else math.floor(steps) + 1) * interval
+
+    def unregister(self, handle: Optional[int]) -> None:
+        if handle is not None:
+            self._animations.pop(handle, None)
+
+    @property
+    def active(self) -> bool:
+        return bool(self._animations)
+
+    def _reschedule(self) -> None:
+        if self._after_id is not None:
+            self._root.after_cancel(self._after_id)
+            self._after_id = None
+        if not self._animations or self._root is None:
+            return  # Idle: no pending tick
+        next_due = min(animation.next_due for animation in self._animations.values())
+        delay = max(self.min_delay, next_due - time.monotonic())
+        try:
+            self._after_id = self._root.after(math.ceil(delay * 1000), self._tick)
+        except tk.TclError:
+            # The root window has been destroyed
+            self._animations.clear()
+            self._root = None
+
+    def _tick(self) -> None:
+        self._after_id = None
+        self.ticks += 1
+        now = time.monotonic()
+        for handle, animation in list(self._animations.items()):
+            if animation.next_due > now:
+                continue
+            animation.next_due = self._next_slot(animation.interval)
+            try:
+                keep = animation.owner.winfo_exists() and animation.callback() is not False
+            except tk.TclError:
+                keep = False
+            except Exception as e:
+                self.logger.error(f"Animation callback failed: {str(e)}")
+                keep = False
+            if not keep:
+                self._animations.pop(handle, None)
+        self._reschedule()
+
+    def stop(self) -> None:
+        """Drop every animation and cancel the pending tick"""
+        self._animations.clear()
+        self._reschedule()
+
+
+# Shared by every widget of the application
+animation_clock = AnimationClock()
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Coroutine, Dict, Optional, Tuple
+from utils.logger import Logger
+
+
+class AsyncRunner:
+    """One asyncio event loop in a background thread, shared by every async feature run
+
+    Runs are asyncio tasks rather than threads, so hundreds of mostly-waiting
+    runs cost one thread in total. Cancelling the run's token cancels its task.
+    Completion callbacks run on a separate thread, so their disk I/O never
+    stalls the loop.
+    """
+
+    def __init__(self):
+        self.logger = Logger("AsyncRunner")
+        self.active = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._completions: Optional[ThreadPoolExecutor] = None
+        self._semaphores: Dict[Tuple[str, int], asyncio.Semaphore] = {}  # Only used on the loop thread
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, daemon=True, name="AsyncRunner")
+                self._thread.start()
+            if self._completions is None:
+                self._completions = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AsyncRunnerDone")
+            return self._loop
+
+    def submit(self, coro: Coroutine, stop_event, on_done: Callable[[Optional[BaseException]], None],
+               key: Optional[str] = None, limit: Optional[int] = None) -> Future:
+        """Schedule a coroutine on the shared loop
+
+        `on_done(error)` is called from a completion thread once the coroutine has
+        ended, cleanup included; error is None on success or cancellation. The
+        returned future resolves after on_done has returned. At most `limit` runs sharing `key` execute
+        at once, the others wait on the loop without holding a thread.
+        """
+        loop = self._ensure_started()
+        completions = self._completions
+        # Resolved once the coroutine has really ended and on_done has returned
+        future: Future = Future()
+        state = {"task": None, "cancelled": False}
+
+        def finish(error: Optional[BaseException], cancelled: bool, result=None):
+            try:
+                on_done(error)
+            except Exception as e:
+                self.logger.error(f"Error in async completion callback: {str(e)}")
+            if future.done():
+                return
+            if cancelled:
+                future.cancel()
+            elif error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+        def done(task: asyncio.Task):
+            # Called on the loop thread after the coroutine's finally blocks: hand over right away
+            unregister()
+            if task.cancelled():
+                coro.close()  # Never started if cancelled before its first step
+                completions.submit(finish, None, True)
+            elif task.exception() is not None:
+                completions.submit(finish, task.exception(), False)
+            else:
+                completions.submit(finish, None, False, task.result())
+
+        # start() and cancel() both run on the loop thread, in either order
+        def start():
+            task = state["task"] = loop.create_task(self._guard(coro, key, limit))
+            task.add_done_callback(done)
+            if state["cancelled"]:
+                task.cancel()
+
+        def cancel():
+            # Only asks the task to stop; completion is reported by done()
+            state["cancelled"] = True
+            if state["task"] is not None:
+                state["task"].cancel()
+
+        unregister = stop_event.on_cancel(lambda: loop.call_soon_threadsafe(cancel))
+        loop.call_soon_threadsafe(start)
+        return future
+
+    async def _guard(self, coro: Coroutine, key: Optional[str], limit: Optional[int]):
+        semaphore = None
+        if key is not None and limit:
+            semaphore = self._semaphores.get((key, limit))
+            if semaphore is None:
+                semaphore = self._semaphores[(key, limit)] = asyncio.Semaphore(limit)
+        try:
+            if semaphore is None:
+                return await self._track(coro)
+            async with semaphore:
+                return await self._track(coro)
+        finally:
+            # Never started if cancelled while waiting for the semaphore
+            coro.close()
+
+    async def _track(self, coro: Coroutine):
+        self.active += 1
+        try:
+            return await coro
+        finally:
+            self.active -= 1
+
+    def shutdown(self) -> None:
+        """Cancel pending runs and stop the loop"""
+        with self._lock:
+            loop, thread, completions = self._loop, self._thread, self._completions
+            self._loop = self._thread = self._completions = None
+        if loop is None:
+            return
+
+        async def cancel_all():
+            # Let cancelled runs unwind so their completion is still reported
+            pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending, timeout=4)
+            loop.stop()
+
+        loop.call_soon_threadsafe(lambda: loop.create_task(cancel_all()))
+        thread.join(timeout=5)
+        # Let the cancelled runs record their completion
+        completions.shutdown(wait=True)
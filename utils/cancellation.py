@@ -0,0 +1,132 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, List, Optional
+from utils.logger import Logger
+
+logger = Logger("Cancellation")
+
+
+class TaskCancelled(Exception):
+    """Raised by CancellationToken.raise_if_cancelled()"""
+
+
+class CancellationToken:
+    """Cancellation signal of one task run
+
+    Drop-in replacement for the threading.Event passed as `stop_event`
+    (is_set/set/wait), with cancel callbacks and an optional deadline.
+    Waiting blocks on the underlying event, so idle tasks do not poll.
+    """
+
+    def __init__(self, timeout: Optional[float] = None, parent: Optional["CancellationToken"] = None):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+        self._timer: Optional[threading.Timer] = None
+        self.reason: Optional[str] = None
+        self.deadline: Optional[float] = None
+
+        if timeout is not None:
+            self.set_deadline(timeout)
+        if parent is not None:
+            self._unlink_parent = parent.on_cancel(lambda: self.cancel(parent.reason))
+        else:
+            self._unlink_parent = None
+
+    def set_deadline(self, timeout: float) -> None:
+        """Cancel with reason "deadline" once `timeout` seconds have passed"""
+        if self._timer is not None:
+            self._timer.cancel()
+        self.deadline = time.monotonic() + timeout
+        self._timer = threading.Timer(timeout, self.cancel, args=("deadline",))
+        self._timer.daemon = True
+        self._timer.start()
+
+    def is_set(self) -> bool:
+        return self._event.is_set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "stopped") -> None:
+        """Cancel the run and call the registered callbacks, once"""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self.reason = reason
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        if self._timer is not None:
+            self._timer.cancel()
+        if self._unlink_parent is not None:
+            self._unlink_parent()
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"Cancel callback failed: {str(e)}")
+
+    def set(self) -> None:
+        self.cancel()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until cancelled or `timeout` elapses; True if cancelled"""
+        return self._event.wait(timeout)
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left before the deadline, None without a deadline"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise TaskCancelled(self.reason)
+
+    def on_cancel(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """Call `callback` on cancellation (right away if already cancelled)
+
+        Callbacks run in the thread calling cancel(), which may be the Tk
+        thread: they must not block, and should hand slow cleanup to a thread.
+        Returns a function that unregisters the callback.
+        """
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return lambda: self._remove(callback)
+        callback()
+        return lambda: None
+
+    def _remove(self, callback: Callable[[], None]) -> None:
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def child(self, timeout: Optional[float] = None) -> "CancellationToken":
+        """Token cancelled with this one, or on its own shorter deadline; close() it when done"""
+        return CancellationToken(timeout=timeout, parent=self)
+
+    def close(self) -> None:
+        """Release the deadline timer and the link to the parent token"""
+        if self._timer is not None:
+            self._timer.cancel()
+        if self._unlink_parent is not None:
+            self._unlink_parent()
+
+
+@contextmanager
+def on_cancel(stop_event, callback: Callable[[], None]):
+    """Register `callback` for the duration of the block
+
+    A plain threading.Event (e.g. in a worker process) has no callbacks; the
+    block then runs without one.
+    """
+    register = getattr(stop_event, "on_cancel", None)
+    unregister = register(callback) if register else None
+    try:
+        yield
+    finally:
+        if unregister:
+            unregister()
@@ -0,0 +1,240 @@
+import hashlib
+import io
+import itertools
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from PIL import Image
+from utils.logger import Logger
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS captures (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT NOT NULL UNIQUE,
+    feature TEXT,
+    source TEXT,
+    created_at REAL NOT NULL,
+    width INTEGER,
+    height INTEGER,
+    size INTEGER,
+    sha1 TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_captures_created ON captures (created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_captures_feature_created ON captures (feature, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_captures_sha1 ON captures (sha1);
+"""
+
+IMAGE_EXTENSIONS = (".png", ".webp", ".jpg", ".jpeg")
+DEFAULT_DIRECTORY = "share/screen_shots"
+
+
+class ScreenshotCatalog:
+    """SQLite index of the captures stored in one directory
+
+    Files that were already in the directory when the index is first created
+    are imported in the background.
+    """
+
+    def __init__(self, directory: str, index_name: str = "catalog.db"):
+        self.directory = directory
+        self.index_path = os.path.join(directory, index_name)
+        self.logger = Logger("ScreenshotCatalog")
+        self._sequence = itertools.count(1)
+        self._lock = threading.Lock()
+
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        new_index = not os.path.exists(self.index_path)
+        self._conn = sqlite3.connect(self.index_path, timeout=10, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+        if new_index:
+            threading.Thread(target=self.import_existing, daemon=True, name="CatalogImport").start()
+
+    def new_name(self, prefix: str = "screenshot", suffix: str = "") -> str:
+        """Base file name (without extension) that no other capture of this process uses"""
+        now = datetime.now()
+        return (
+            f"{prefix}_{now.strftime('%Y%m%d_%H%M%S')}_{now.microsecond // 1000:03d}"
+            f"_{os.getpid()}_{next(self._sequence):04d}{suffix}"
+        )
+
+    def add(self, path: str, data: bytes, size: Tuple[int, int], feature: Optional[str] = None,
+            source: Optional[str] = None, created_at: Optional[float] = None) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO captures (path, feature, source, created_at, width, height, size, sha1) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (os.path.abspath(path), feature, source, created_at or time.time(),
+                 size[0], size[1], len(data), hashlib.sha1(data).hexdigest())
+            )
+
+    def import_existing(self) -> int:
+        """Index image files of the directory that are not in the catalog yet"""
+        with self._lock:
+            known = {row[0] for row in self._conn.execute("SELECT path FROM captures")}
+        imported = 0
+        for entry in os.scandir(self.directory):
+            path = os.path.abspath(entry.path)
+            if not entry.is_file() or not entry.name.lower().endswith(IMAGE_EXTENSIONS) or path in known:
+                continue
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                with Image.open(io.BytesIO(data)) as image:
+                    size = image.size
+                self.add(path, data, size, created_at=entry.stat().st_mtime)
+                imported += 1
+            except (OSError, sqlite3.Error) as e:
+                self.logger.warning(f"Could not index {path}: {str(e)}")
+        if imported:
+            self.logger.info(f"Indexed {imported} existing captures in {self.directory}")
+        return imported
+
+    def count(self, feature: Optional[str] = None) -> int:
+        with self._lock:
+            if feature:
+                return self._conn.execute("SELECT COUNT(*) FROM captures WHERE feature = ?", (feature,)).fetchone()[0]
+            return self._conn.execute("SELECT COUNT(*) FROM captures").fetchone()[0]
+
+    def page(self, offset: int, limit: int, feature: Optional[str] = None) -> List[sqlite3.Row]:
+        """Captures from newest to oldest"""
+        with self._lock:
+            if feature:
+                return self._conn.execute(
+                    "SELECT * FROM captures WHERE feature = ? ORDER BY created_at DESC LIMIT ? OFFSET ?",
+                    (feature, limit, offset)
+                ).fetchall()
+            return self._conn.execute(
+                "SELECT * FROM captures ORDER BY created_at DESC LIMIT ? OFFSET ?", (limit, offset)
+            ).fetchall()
+
+    def features(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute(
+                "SELECT DISTINCT feature FROM captures WHERE feature IS NOT NULL ORDER BY feature"
+            )]
+
+    def find_by_hash(self, sha1: str) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute("SELECT * FROM captures WHERE sha1 = ?", (sha1,)).fetchall()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_catalogs: Dict[str, ScreenshotCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(directory: str) -> ScreenshotCatalog:
+    """Shared catalog of a capture directory"""
+    key = os.path.abspath(directory)
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = _catalogs[key] = ScreenshotCatalog(directory)
+        return catalog
+
+
+class ThumbnailCache:
+    """Thumbnails generated on a background worker, kept in memory (LRU) and on disk
+
+    request() never blocks: a cached thumbnail is returned right away, otherwise
+    the callback is called from the worker thread once it is ready.
+    """
+
+    def __init__(self, directory: str, size: Tuple[int, int] = (160, 100), cache_size: int = 300):
+        self.directory = os.path.join(directory, ".thumbs")
+        self.size = size
+        self.cache_size = cache_size
+        self.logger = Logger("ThumbnailCache")
+        self._cache: "OrderedDict[str, Image.Image]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._queue = queue.LifoQueue()  # Most recent requests are the visible thumbnails
+        self._pending = set()
+        self._thread = threading.Thread(target=self._worker, daemon=True, name="ThumbnailWorker")
+        self._thread.start()
+
+    def request(self, path: str, sha1: Optional[str],
+                callback: Callable[[str, Image.Image], None]) -> Optional[Image.Image]:
+        with self._lock:
+            image = self._cache.get(path)
+            if image is not None:
+                self._cache.move_to_end(path)
+                return image
+            if path in self._pending:
+                return None
+            self._pending.add(path)
+        # Identical captures share one thumbnail file on disk
+        thumb_name = sha1 or hashlib.sha1(path.encode("utf-8")).hexdigest()
+        self._queue.put((path, thumb_name, callback))
+        return None
+
+    def _worker(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            path, thumb_name, callback = item
+            try:
+                image = self._load(path, thumb_name)
+            except Exception as e:
+                # Unreadable or oversized images must not stop the worker
+                self.logger.warning(f"Could not create thumbnail for {path}: {str(e)}")
+                image = None
+            with self._lock:
+                self._pending.discard(path)
+                if image is not None:
+                    self._cache[path] = image
+                    self._cache.move_to_end(path)
+                    while len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+            if image is not None:
+                try:
+                    callback(path, image)
+                except Exception as e:
+                    self.logger.warning(f"Thumbnail callback failed for {path}: {str(e)}")
+
+    def _load(self, path: str, thumb_name: str) -> Image.Image:
+        thumb_path = os.path.join(self.directory, f"{thumb_name}.png")
+        if os.path.exists(thumb_path):
+            with Image.open(thumb_path) as thumb:
+                return thumb.copy()
+
+        with Image.open(path) as image:
+            image.draft("RGB", self.size)  # Reduced-size decoding for JPEG
+            image.thumbnail(self.size)
+            thumb = image.convert("RGB")
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{thumb_path}.part"
+        thumb.save(tmp_path, "PNG")
+        os.replace(tmp_path, thumb_path)
+        return thumb
+
+    def clear_pending(self):
+        """Drop queued requests, e.g. when the gallery moves to another page"""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)
+                break
+            with self._lock:
+                self._pending.discard(item[0])
+
+    def close(self):
+        self.clear_pending()
+        self._queue.put(None)
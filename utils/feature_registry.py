@@ -0,0 +1,159 @@
+import ast
+import importlib
+import inspect
+import json
+import os
+import threading
+from dataclasses import dataclass, asdict
+from typing import List, Optional
+from utils.logger import Logger
+
+EXCLUDED_MODULES = ["__init__.py", "base_feature.py"]
+
+
+@dataclass
+class FeatureSpec:
+    """Feature metadata known without importing its module"""
+
+    module: str
+    class_name: str
+    name: str
+    icon: str
+
+
+class LazyFeature:
+    """Proxy exposing name and icon, importing and initializing the feature on first use"""
+
+    def __init__(self, spec: FeatureSpec, package: str = "features"):
+        self.spec = spec
+        self.package = package
+        self._instance = None
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self.spec.name
+
+    @property
+    def icon(self) -> str:
+        return self.spec.icon
+
+    @property
+    def loaded(self) -> bool:
+        return self._instance is not None
+
+    @property
+    def instance(self):
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    module = importlib.import_module(f"{self.package}.{self.spec.module}")
+                    feature = getattr(module, self.spec.class_name)()
+                    feature.init()
+                    self._instance = feature
+        return self._instance
+
+    def __getattr__(self, attr):
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        return getattr(self.instance, attr)
+
+
+class FeatureRegistry:
+    """Discovers features from the AST of their modules, cached in a manifest by mtime"""
+
+    def __init__(self, features_dir: str = "features", manifest_path: str = ".cache/feature_manifest.json"):
+        self.features_dir = features_dir
+        self.package = features_dir.replace(os.sep, ".")
+        self.manifest_path = manifest_path
+        self.logger = Logger("FeatureRegistry")
+
+    def discover(self) -> List[LazyFeature]:
+        manifest = self._read_manifest()
+        updated = {}
+        specs = []
+
+        for file in sorted(os.listdir(self.features_dir)):
+            if not file.endswith(".py") or file in EXCLUDED_MODULES:
+                continue
+            path = os.path.join(self.features_dir, file)
+            mtime = os.path.getmtime(path)
+            entry = manifest.get(file)
+
+            if entry is None or entry["mtime"] != mtime:
+                try:
+                    entry = {"mtime": mtime, "features": self._scan(file[:-3], path)}
+                except Exception as e:
+                    self.logger.error(f"Error scanning feature {file}: {str(e)}")
+                    continue
+
+            updated[file] = entry
+            specs.extend(FeatureSpec(**spec) for spec in entry["features"])
+
+        if updated != manifest:
+            self._write_manifest(updated)
+
+        return [LazyFeature(spec, self.package) for spec in specs]
+
+    def _scan(self, module_name: str, path: str) -> List[dict]:
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+
+        specs = []
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef) or not self._is_feature_class(node):
+                continue
+            name = self._property_constant(node, "name")
+            icon = self._property_constant(node, "icon")
+            if name is None or icon is None:
+                # Metadata is computed: fall back to importing the module once
+                name, icon = self._import_metadata(module_name, node.name)
+            specs.append(asdict(FeatureSpec(module_name, node.name, name, icon)))
+        return specs
+
+    @staticmethod
+    def _is_feature_class(node: ast.ClassDef) -> bool:
+        for base in node.bases:
+            if isinstance(base, ast.Name) and base.id == "BaseFeature":
+                return True
+            if isinstance(base, ast.Attribute) and base.attr == "BaseFeature":
+                return True
+        return False
+
+    @staticmethod
+    def _property_constant(node: ast.ClassDef, attr: str) -> Optional[str]:
+        for item in node.body:
+            if isinstance(item, ast.FunctionDef) and item.name == attr:
+                for stmt in item.body:
+                    if (isinstance(stmt, ast.Return) and
+                            isinstance(stmt.value, ast.Constant) and
+                            isinstance(stmt.value.value, str)):
+                        return stmt.value.value
+        return None
+
+    def _import_metadata(self, module_name: str, class_name: str):
+        module = importlib.import_module(f"{self.package}.{module_name}")
+        cls = getattr(module, class_name)
+        if inspect.isabstract(cls):
+            raise TypeError(f"{class_name} is abstract")
+        feature = cls()
+        return feature.name, feature.icon
+
+    def _read_manifest(self) -> dict:
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_manifest(self, manifest: dict) -> None:
+        directory = os.path.dirname(self.manifest_path)
+        try:
+            if directory and not os.path.exists(directory):
+                os.makedirs(directory)
+            tmp_path = f"{self.manifest_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(tmp_path, self.manifest_path)
+        except OSError as e:
+            self.logger.warning(f"Could not write feature manifest: {str(e)}")
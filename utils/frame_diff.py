@@ -0,0 +1,87 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from PIL import Image, ImageChops, ImageStat
+
+
+@dataclass
+class FrameChange:
+    changed: bool
+    score: float
+    # Changed region in full-frame coordinates, None when nothing changed
+    bbox: Optional[Tuple[int, int, int, int]]
+
+
+class FrameChangeDetector:
+    """Compares each frame to the previous one on a downscaled grayscale copy
+
+    "diff" scores the mean absolute pixel difference in percent; "hash" scores
+    the number of differing bits between 64-bit difference hashes.
+    """
+
+    def __init__(self, threshold: float = 1.0, method: str = "diff",
+                 sample_size: Tuple[int, int] = (64, 64), pixel_threshold: int = 16):
+        if method not in ("diff", "hash"):
+            raise ValueError(f"Unknown change detection method: {method}")
+        self.threshold = threshold
+        self.method = method
+        self.sample_size = sample_size
+        self.pixel_threshold = pixel_threshold
+        self._previous: Optional[Image.Image] = None
+        self._previous_size: Optional[Tuple[int, int]] = None
+
+    def check(self, frame: Image.Image) -> FrameChange:
+        sample = frame.convert("L").resize(self.sample_size, Image.Resampling.BILINEAR)
+        previous, previous_size = self._previous, self._previous_size
+
+        if previous is None or previous_size != frame.size:
+            self._remember(sample, frame.size)
+            return FrameChange(True, 100.0, (0, 0, frame.width, frame.height))
+
+        diff = ImageChops.difference(sample, previous)
+        if self.method == "hash":
+            score = float(bin(self._dhash(sample) ^ self._dhash(previous)).count("1"))
+        else:
+            score = ImageStat.Stat(diff).mean[0] * 100 / 255
+
+        if score < self.threshold:
+            # Keep the reference frame so slow drifts still add up to a change
+            return FrameChange(False, score, None)
+
+        self._remember(sample, frame.size)
+        return FrameChange(True, score, self._changed_bbox(diff, frame.size))
+
+    def _remember(self, sample: Image.Image, size: Tuple[int, int]) -> None:
+        self._previous = sample
+        self._previous_size = size
+
+    def _changed_bbox(self, diff: Image.Image, size: Tuple[int, int]):
+        mask = diff.point(lambda p: 255 if p > self.pixel_threshold else 0)
+        bbox = mask.getbbox()
+        if bbox is None:
+            return (0, 0, size[0], size[1])
+        # Scale sample cells back to frame pixels, rounding outwards
+        sx = size[0] / self.sample_size[0]
+        sy = size[1] / self.sample_size[1]
+        left, top, right, bottom = bbox
+        return (
+            int(left * sx),
+            int(top * sy),
+            min(size[0], int(right * sx + 0.999)),
+            min(size[1], int(bottom * sy + 0.999)),
+        )
+
+    @staticmethod
+    def _dhash(sample: Image.Image) -> int:
+        small = sample.resize((9, 8), Image.Resampling.BILINEAR)
+        pixels = list(small.getdata())
+        value = 0
+        for row in range(8):
+            for col in range(8):
+                left = pixels[row * 9 + col]
+                right = pixels[row * 9 + col + 1]
+                value = (value << 1) | (left > right)
+        return value
+
+    def reset(self) -> None:
+        self._previous = None
+        self._previous_size = None
@@ -0,0 +1,143 @@
+import json
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from typing import Any, Dict, List, Optional
+from utils.logger import Logger
+from utils.task_store import FAILED_STATUSES
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS task_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task_id INTEGER NOT NULL,
+    feature TEXT NOT NULL,
+    parameters TEXT,
+    started_at REAL NOT NULL,
+    ended_at REAL,
+    status TEXT NOT NULL,
+    duration REAL,
+    artifacts TEXT,
+    output TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_task_runs_feature_started ON task_runs (feature, started_at DESC);
+CREATE INDEX IF NOT EXISTS idx_task_runs_status_started ON task_runs (status, started_at DESC);
+"""
+
+COLUMNS = ("task_id", "feature", "parameters", "started_at", "ended_at", "status", "duration", "artifacts", "output")
+
+
+def sqlite_path(database_url: str) -> Optional[str]:
+    """Path of a sqlite:/// URL, or None for other databases"""
+    prefix = "sqlite:///"
+    if not database_url.startswith(prefix):
+        return None
+    return database_url[len(prefix):] or ":memory:"
+
+
+class TaskHistory:
+    """Task runs stored in SQLite through a write-behind queue
+
+    record() only enqueues; a writer thread inserts pending runs in batches,
+    one transaction per batch, on a WAL-mode connection.
+    """
+
+    def __init__(self, database_url: str, batch_size: int = 100, flush_interval: float = 0.5):
+        self.logger = Logger("TaskHistory")
+        self.path = sqlite_path(database_url)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enabled = self.path is not None
+        self.written = 0
+        self._queue = queue.Queue()
+        self._thread = None
+
+        if not self.enabled:
+            self.logger.warning(f"Task history disabled: unsupported database {database_url}")
+            return
+
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+        self._thread = threading.Thread(target=self._writer, daemon=True, name="TaskHistoryWriter")
+        self._thread.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def record(self, task_id: int, feature: str, parameters: Dict[str, Any], started_at: float,
+               ended_at: float, status: str, artifacts: List[str] = (), output: str = "") -> None:
+        """Queue a finished run; never blocks on disk"""
+        if not self.enabled:
+            return
+        params = {k: v for k, v in parameters.items() if k != "stop_event"}
+        self._queue.put((
+            task_id,
+            feature,
+            json.dumps(params, default=str),
+            started_at,
+            ended_at,
+            status,
+            ended_at - started_at,
+            json.dumps(list(artifacts)),
+            output,
+        ))
+
+    def _writer(self):
+        conn = self._connect()
+        sql = f"INSERT INTO task_runs ({', '.join(COLUMNS)}) VALUES ({', '.join('?' for _ in COLUMNS)})"
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            if None in batch:
+                running = False
+                batch = [row for row in batch if row is not None]
+            if not batch:
+                continue
+            try:
+                with conn:
+                    conn.executemany(sql, batch)
+                self.written += len(batch)
+            except sqlite3.Error as e:
+                self.logger.error(f"Could not write {len(batch)} task runs: {str(e)}")
+        conn.close()
+
+    def last_runs(self, feature: Optional[str] = None, limit: int = 20) -> List[sqlite3.Row]:
+        if not self.enabled:
+            return []
+        with closing(self._connect()) as conn:
+            if feature:
+                return conn.execute(
+                    "SELECT * FROM task_runs WHERE feature = ? ORDER BY started_at DESC LIMIT ?",
+                    (feature, limit)
+                ).fetchall()
+            return conn.execute(
+                "SELECT * FROM task_runs ORDER BY started_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+
+    def failures(self, hours: float = 24, limit: int = 100) -> List[sqlite3.Row]:
+        if not self.enabled:
+            return []
+        since = time.time() - hours * 3600
+        with closing(self._connect()) as conn:
+            return conn.execute(
+                f"SELECT * FROM task_runs WHERE status IN ({', '.join('?' for _ in FAILED_STATUSES)}) "
+                "AND started_at >= ? ORDER BY started_at DESC LIMIT ?",
+                (*FAILED_STATUSES, since, limit)
+            ).fetchall()
+
+    def close(self) -> None:
+        """Flush pending runs and stop the writer"""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5)
@@ -0,0 +1,79 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+from PIL import Image, ImageTk
+from utils.logger import Logger
+
+
+class IconCache:
+    """Rasterized icons shared across widgets: in-memory LRU backed by PNG files on disk"""
+
+    def __init__(self, icons_dir: str = "icons", cache_dir: str = ".cache/icons", max_entries: int = 128):
+        self.icons_dir = icons_dir
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.logger = Logger("IconCache")
+
+    def get(self, icon: str, size: int, color: str = "white") -> Optional[ImageTk.PhotoImage]:
+        """Return a PhotoImage for the icon, or None if it cannot be rendered (Tk main thread)"""
+        key = (icon, size, color)
+        with self._lock:
+            if key in self._images:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return self._images[key]
+            self.misses += 1
+
+        try:
+            image = self._load(icon, size, color)
+        except Exception as e:
+            self.logger.warning(f"Could not render icon {icon}: {str(e)}")
+            image = None
+        photo = ImageTk.PhotoImage(image) if image is not None else None
+
+        with self._lock:
+            self._images[key] = photo
+            if len(self._images) > self.max_entries:
+                self._images.popitem(last=False)
+        return photo
+
+    def _load(self, icon: str, size: int, color: str) -> Optional[Image.Image]:
+        if icon.startswith('fa'):
+            source = None
+        else:
+            source = os.path.join(self.icons_dir, f"{icon}.png")
+            if not os.path.exists(source):
+                return None
+
+        cached = self._cache_path(icon, size, color)
+        if os.path.exists(cached) and (
+            source is None or os.path.getmtime(cached) >= os.path.getmtime(source)
+        ):
+            return Image.open(cached).copy()
+
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+
+        if source is None:
+            # QtAwesome (and PyQt5 with it) is only imported on a disk cache miss
+            import qtawesome as qta
+            qta.icon(icon, color=color).to_image(size, size).save(cached)
+            return Image.open(cached).copy()
+
+        img = Image.open(source)
+        img = img.resize((size, size), Image.Resampling.LANCZOS)
+        img.save(cached)
+        return img
+
+    def _cache_path(self, icon: str, size: int, color: str) -> str:
+        digest = hashlib.sha1(f"{icon}|{size}|{color}".encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{digest}.png")
+
+
+icon_cache = IconCache()
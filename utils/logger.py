@@ -1,45 +1,150 @@
+import atexit
+import glob
+import gzip
 import logging
-from datetime import datetime
 import os
+import queue
+import shutil
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+
+LOG_DIR = 'logs'
+LOG_FILE = os.path.join(LOG_DIR, 'app.log')
+
+
+class CompressedRotatingFileHandler(TimedRotatingFileHandler):
+    """Rotation à minuit ou au-delà d'une taille, avec compression gzip"""
+
+    def __init__(self, filename: str, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 14):
+        super().__init__(filename, when='midnight', backupCount=0, encoding='utf-8', delay=True)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.namer = self._namer
+        self.rotator = self._rotator
+
+    def shouldRollover(self, record) -> bool:
+        if super().shouldRollover(record):
+            return True
+        if self.max_bytes > 0 and self.stream is not None:
+            self.stream.seek(0, 2)
+            return self.stream.tell() >= self.max_bytes
+        return False
+
+    @staticmethod
+    def _namer(default_name: str) -> str:
+        # Plusieurs rotations le même jour : suffixe numérique plutôt qu'écrasement
+        name = f"{default_name}.gz"
+        index = 1
+        while os.path.exists(name):
+            name = f"{default_name}.{index}.gz"
+            index += 1
+        return name
+
+    def _rotator(self, source: str, dest: str) -> None:
+        with open(source, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+            shutil.copyfileobj(f_in, f_out)
+        os.remove(source)
+        self._prune()
+
+    def _prune(self) -> None:
+        archives = sorted(glob.glob(f"{self.baseFilename}.*.gz"), key=os.path.getmtime)
+        for path in archives[:-self.backup_count or None]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+class CountingQueueHandler(QueueHandler):
+    """Enqueue sans bloquer ; les messages qui ne rentrent pas sont comptés"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.enqueued = 0
+        self.dropped = 0
+        self.enqueue_time = 0.0
+
+    def enqueue(self, record) -> None:
+        start = time.perf_counter()
+        try:
+            self.queue.put_nowait(record)
+            self.enqueued += 1
+        except queue.Full:
+            self.dropped += 1
+        self.enqueue_time += time.perf_counter() - start
+
+
+_setup_lock = threading.Lock()
+_queue_handler = None
+_listener = None
+
+
+def _setup_backend() -> CountingQueueHandler:
+    """Configurer une seule fois les handlers du processus, derrière une file"""
+    global _queue_handler, _listener
+    with _setup_lock:
+        if _queue_handler is not None:
+            return _queue_handler
 
-class Logger:
-    def __init__(self, name: str):
         # Créer le dossier logs s'il n'existe pas
-        if not os.path.exists('logs'):
-            os.makedirs('logs')
-            
-        # Configuration du logger
-        self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.DEBUG)
-        
+        if not os.path.exists(LOG_DIR):
+            os.makedirs(LOG_DIR)
+
         # Format du log
         formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
-        
+
         # Handler pour fichier
-        file_handler = logging.FileHandler(
-            f'logs/{datetime.now().strftime("%Y-%m-%d")}.log'
-        )
+        file_handler = CompressedRotatingFileHandler(LOG_FILE)
         file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
-        
+
         # Handler pour console
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
-    
+
+        log_queue = queue.Queue(maxsize=10000)
+        _queue_handler = CountingQueueHandler(log_queue)
+        _listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+        return _queue_handler
+
+
+class Logger:
+    def __init__(self, name: str):
+        handler = _setup_backend()
+
+        # Configuration du logger (idempotente : un seul handler par logger)
+        self.logger = logging.getLogger(name)
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        if handler not in self.logger.handlers:
+            self.logger.addHandler(handler)
+
+    @staticmethod
+    def stats() -> dict:
+        """Coût et pertes de l'enqueue des logs"""
+        handler = _setup_backend()
+        return {
+            "enqueued": handler.enqueued,
+            "dropped": handler.dropped,
+            "queue_depth": handler.queue.qsize(),
+            "avg_enqueue_us": handler.enqueue_time / handler.enqueued * 1e6 if handler.enqueued else 0.0,
+        }
+
     def debug(self, message: str):
         self.logger.debug(message)
-        
+
     def info(self, message: str):
         self.logger.info(message)
-        
+
     def warning(self, message: str):
         self.logger.warning(message)
-        
+
     def error(self, message: str):
         self.logger.error(message)
-        
+
     def critical(self, message: str):
         self.logger.critical(message)
@@ -0,0 +1,195 @@
+import contextvars
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+# Metrics of the task running in the current thread/context
+_current: contextvars.ContextVar[Optional["TaskMetrics"]] = contextvars.ContextVar("task_metrics", default=None)
+
+
+class TaskMetrics:
+    """Phase timings and counters collected during one task run"""
+
+    def __init__(self, task_id: int, feature: str):
+        self.task_id = task_id
+        self.feature = feature
+        self.started_at = time.time()
+        self._start = time.monotonic()
+        self._end: Optional[float] = None
+        self.spans: List[Tuple[str, float]] = []
+        self.counters: Dict[str, float] = defaultdict(float)
+        self.artifacts: List[str] = []
+        self.active: Dict[int, Tuple[str, float]] = {}  # thread id -> (span, start)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str):
+        thread_id = threading.get_ident()
+        start = time.monotonic()
+        with self._lock:
+            previous = self.active.get(thread_id)
+            self.active[thread_id] = (name, start)
+        try:
+            yield
+        finally:
+            duration = time.monotonic() - start
+            with self._lock:
+                self.spans.append((name, duration))
+                if previous is None:
+                    self.active.pop(thread_id, None)
+                else:
+                    self.active[thread_id] = previous
+
+    def count(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self.counters[name] += value
+
+    def artifact(self, path: str) -> None:
+        """Record a file produced by the task"""
+        with self._lock:
+            self.artifacts.append(path)
+
+    def finish(self) -> None:
+        self._end = time.monotonic()
+
+    @property
+    def finished(self) -> bool:
+        return self._end is not None
+
+    @property
+    def elapsed(self) -> float:
+        return (self._end or time.monotonic()) - self._start
+
+    def current_phase(self) -> Optional[Tuple[str, float]]:
+        """Most recently started open span and how long it has been running"""
+        with self._lock:
+            if not self.active:
+                return None
+            name, start = max(self.active.values(), key=lambda item: item[1])
+        return name, time.monotonic() - start
+
+    def to_dict(self, status: str) -> dict:
+        with self._lock:
+            spans = [{"name": name, "duration": round(duration, 6)} for name, duration in self.spans]
+            counters = dict(self.counters)
+            artifacts = list(self.artifacts)
+        return {
+            "task_id": self.task_id,
+            "feature": self.feature,
+            "status": status,
+            "started_at": datetime.fromtimestamp(self.started_at).isoformat(),
+            "duration": round(self.elapsed, 6),
+            "spans": spans,
+            "counters": counters,
+            "artifacts": artifacts,
+        }
+
+
+@contextmanager
+def activate(metrics: TaskMetrics):
+    """Make `metrics` the target of span()/count() in the current context"""
+    token = _current.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _current.reset(token)
+
+
+def current() -> Optional[TaskMetrics]:
+    return _current.get()
+
+
+@contextmanager
+def span(name: str):
+    """Time a phase of the current task; a no-op outside of a task"""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    with metrics.span(name):
+        yield
+
+
+def count(name: str, value: float = 1) -> None:
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.count(name, value)
+
+
+def artifact(path: str) -> None:
+    metrics = _current.get()
+    if metrics is not None:
+        metrics.artifact(path)
+
+
+class MetricsExporter:
+    """Appends task runs as JSON lines and keeps a Prometheus text file of aggregates"""
+
+    def __init__(self, directory: str = "metrics"):
+        self.directory = directory
+        self.jsonl_path = os.path.join(directory, "tasks.jsonl")
+        self.prom_path = os.path.join(directory, "metrics.prom")
+        self._lock = threading.Lock()
+        self._tasks = defaultdict(lambda: [0, 0.0])  # (feature, status) -> [count, seconds]
+        self._spans = defaultdict(lambda: [0, 0.0])  # (feature, span) -> [count, seconds]
+        self._counters = defaultdict(float)  # (feature, counter) -> total
+
+    def export(self, metrics: TaskMetrics, status: str) -> None:
+        record = metrics.to_dict(status)
+        with self._lock:
+            if not os.path.exists(self.directory):
+                os.makedirs(self.directory)
+            with open(self.jsonl_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+
+            task = self._tasks[(metrics.feature, status)]
+            task[0] += 1
+            task[1] += record["duration"]
+            for item in record["spans"]:
+                agg = self._spans[(metrics.feature, item["name"])]
+                agg[0] += 1
+                agg[1] += item["duration"]
+            for name, value in record["counters"].items():
+                self._counters[(metrics.feature, name)] += value
+            self._write_prometheus()
+
+    def _write_prometheus(self) -> None:
+        lines = [
+            "# HELP shortcuts_task_duration_seconds Task run duration",
+            "# TYPE shortcuts_task_duration_seconds summary",
+        ]
+        for (feature, status), (n, total) in sorted(self._tasks.items()):
+            labels = f'feature="{_escape(feature)}",status="{status}"'
+            lines.append(f"shortcuts_task_duration_seconds_count{{{labels}}} {n}")
+            lines.append(f"shortcuts_task_duration_seconds_sum{{{labels}}} {total:.6f}")
+
+        lines += [
+            "# HELP shortcuts_span_duration_seconds Duration of instrumented task phases",
+            "# TYPE shortcuts_span_duration_seconds summary",
+        ]
+        for (feature, name), (n, total) in sorted(self._spans.items()):
+            labels = f'feature="{_escape(feature)}",span="{_escape(name)}"'
+            lines.append(f"shortcuts_span_duration_seconds_count{{{labels}}} {n}")
+            lines.append(f"shortcuts_span_duration_seconds_sum{{{labels}}} {total:.6f}")
+
+        lines += [
+            "# HELP shortcuts_task_counter_total Counters reported by features",
+            "# TYPE shortcuts_task_counter_total counter",
+        ]
+        for (feature, name), value in sorted(self._counters.items()):
+            labels = f'feature="{_escape(feature)}",name="{_escape(name)}"'
+            lines.append(f"shortcuts_task_counter_total{{{labels}}} {value}")
+
+        tmp_path = f"{self.prom_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, self.prom_path)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,55 @@
+import threading
+import time
+from typing import Callable, Optional
+from utils.cancellation import CancellationToken
+
+
+class PeriodicScheduler:
+    """Runs a callback on monotonic deadlines in the calling thread, without drift
+
+    Deadlines are start + k * interval, so the time spent in the callback does not
+    push later occurrences back. Deadlines that have already passed by a full
+    interval are skipped and counted as missed instead of firing in a burst.
+    """
+
+    def __init__(self, interval: float, occurrences: int, callback: Callable[[], None],
+                 stop_event: Optional[threading.Event] = None):
+        self.interval = interval
+        self.occurrences = occurrences
+        self.callback = callback
+        self.stop_event = stop_event or CancellationToken()
+
+        self.runs = 0
+        self.missed = 0
+        self.total_jitter = 0.0
+        self.max_jitter = 0.0
+
+    def run(self) -> None:
+        start = time.monotonic()
+        for k in range(self.occurrences):
+            deadline = start + k * self.interval
+            now = time.monotonic()
+            if self.interval > 0 and now >= deadline + self.interval:
+                # Already a full interval late: skip rather than fire in a burst
+                self.missed += 1
+                continue
+            # wait() returns as soon as the stop event is set
+            if self.stop_event.wait(max(0.0, deadline - now)):
+                break
+
+            jitter = time.monotonic() - deadline
+            self.total_jitter += jitter
+            self.max_jitter = max(self.max_jitter, jitter)
+            self.callback()
+            self.runs += 1
+
+    def stop(self) -> None:
+        self.stop_event.set()
+
+    def stats(self) -> dict:
+        return {
+            "runs": self.runs,
+            "missed": self.missed,
+            "avg_jitter": self.total_jitter / self.runs if self.runs else 0.0,
+            "max_jitter": self.max_jitter,
+        }
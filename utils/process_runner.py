@@ -0,0 +1,97 @@
+import importlib
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
+from utils.cancellation import on_cancel
+
+# Feature instances kept alive inside each pooled worker process
+_instances = {}
+
+
+class _QueueWriter:
+    """stdout replacement in worker processes, forwarding lines to the parent"""
+
+    def __init__(self, output):
+        self.output = output
+
+    def write(self, text: str):
+        if text.strip():
+            self.output.put(text.strip())
+
+    def flush(self):
+        pass
+
+
+def _run_in_process(module: str, class_name: str, values: dict, output, cancel_event) -> None:
+    sys.stdout = _QueueWriter(output)
+    try:
+        key = (module, class_name)
+        if key not in _instances:
+            feature = getattr(importlib.import_module(module), class_name)()
+            feature.init()
+            _instances[key] = feature
+        _instances[key].main(**values, stop_event=cancel_event)
+    except Exception as e:
+        # Arbitrary exceptions may not pickle back to the parent
+        raise RuntimeError(f"{type(e).__name__}: {str(e)}") from None
+    finally:
+        sys.stdout.flush()
+        sys.stdout = sys.__stdout__
+
+
+class ProcessRunner:
+    """Runs feature main() in a pool of worker processes, streaming output and cancellation"""
+
+    def __init__(self, max_processes: Optional[int] = None, poll_interval: float = 0.1):
+        self.max_processes = max_processes or os.cpu_count() or 2
+        self.poll_interval = poll_interval
+        self._pool = None
+        self._manager = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._pool is None:
+                self._manager = multiprocessing.Manager()
+                self._pool = ProcessPoolExecutor(max_workers=self.max_processes)
+        return self._pool, self._manager
+
+    def run(self, feature, values: dict, stop_event: threading.Event,
+            output: Callable[[str], None] = print) -> None:
+        """Block the calling thread until the feature finishes in a worker process"""
+        pool, manager = self._ensure_started()
+        instance = getattr(feature, "instance", feature)
+        cls = type(instance)
+        out_queue = manager.Queue()
+        cancel_event = manager.Event()
+        values = {k: v for k, v in values.items() if k != "stop_event"}
+
+        future = pool.submit(_run_in_process, cls.__module__, cls.__name__, values, out_queue, cancel_event)
+        # Queued after every line of the worker: the reader blocks instead of polling
+        future.add_done_callback(lambda _: out_queue.put(None))
+        # A cancellation token forwards the stop right away; a plain event is checked periodically
+        timeout = None if hasattr(stop_event, "on_cancel") else self.poll_interval
+        with on_cancel(stop_event, cancel_event.set):
+            while True:
+                try:
+                    line = out_queue.get(timeout=timeout)
+                except queue.Empty:
+                    if stop_event.is_set() and not cancel_event.is_set():
+                        cancel_event.set()
+                    continue
+                if line is None:
+                    break
+                output(line)
+        future.result()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._manager.shutdown()
+                self._pool = None
+                self._manager = None
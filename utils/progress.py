@@ -0,0 +1,114 @@
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+from utils.task_store import ACTIVE_STATUSES
+
+# Progress sink of the task running in the current thread/context
+_current: contextvars.ContextVar[Optional[Callable]] = contextvars.ContextVar("task_progress", default=None)
+
+
+@dataclass
+class Progress:
+    current: float
+    total: Optional[float]
+    message: str
+    started: float  # monotonic time of the first report
+    updated: float
+
+    @property
+    def fraction(self) -> Optional[float]:
+        if not self.total:
+            return None
+        return max(0.0, min(1.0, self.current / self.total))
+
+    def eta(self) -> Optional[float]:
+        """Seconds left at the average rate since the first report"""
+        if not self.total or self.current <= 0:
+            return None
+        rate = self.current / max(self.updated - self.started, 1e-6)
+        return max(0.0, (self.total - self.current) / rate)
+
+
+def format_eta(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return ""
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"ETA {seconds // 3600}h {seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"ETA {seconds // 60}m {seconds % 60:02d}s"
+    return f"ETA {seconds}s"
+
+
+@contextmanager
+def activate(sink: Callable[[float, Optional[float], str], None]):
+    """Send report() calls of the current context to `sink`"""
+    token = _current.set(sink)
+    try:
+        yield sink
+    finally:
+        _current.reset(token)
+
+
+def report(current: float, total: Optional[float] = None, message: str = "") -> None:
+    """Report progress of the current task; a no-op outside of a task"""
+    sink = _current.get()
+    if sink is not None:
+        sink(current, total, message)
+
+
+class TaskUpdates:
+    """Latest status and progress per task, posted from any thread
+
+    Posting only overwrites the previous value under a lock; the UI drains
+    the pending values at its own fixed rate, so a feature reporting
+    thousands of times a second costs one widget update per refresh.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._statuses: Dict[int, Tuple[str, str]] = {}
+        self._progress: Dict[int, Progress] = {}
+        self._dirty = set()
+        self.posted = 0
+
+    def post_status(self, task_id: int, status: str, color: str) -> None:
+        with self._lock:
+            pending = self._statuses.get(task_id)
+            if pending is not None and pending[0] not in ACTIVE_STATUSES and status in ACTIVE_STATUSES:
+                return  # A final status is never replaced before it is applied
+            self._statuses[task_id] = (status, color)
+
+    def post_progress(self, task_id: int, current: float, total: Optional[float] = None,
+                      message: str = "") -> None:
+        now = time.monotonic()
+        with self._lock:
+            self.posted += 1
+            previous = self._progress.get(task_id)
+            started = previous.started if previous is not None else now
+            self._progress[task_id] = Progress(current, total, message, started, now)
+            self._dirty.add(task_id)
+
+    def reporter(self, task_id: int) -> Callable[[float, Optional[float], str], None]:
+        return lambda current, total=None, message="": self.post_progress(task_id, current, total, message)
+
+    @property
+    def pending(self) -> bool:
+        with self._lock:
+            return bool(self._statuses or self._dirty)
+
+    def drain(self) -> Tuple[Dict[int, Tuple[str, str]], Dict[int, Progress]]:
+        """Status changes and progress values posted since the last drain"""
+        with self._lock:
+            statuses, self._statuses = self._statuses, {}
+            progress = {task_id: self._progress[task_id] for task_id in self._dirty}
+            self._dirty.clear()
+        return statuses, progress
+
+    def forget(self, task_id: int) -> None:
+        with self._lock:
+            self._progress.pop(task_id, None)
+            self._dirty.discard(task_id)
@@ -0,0 +1,178 @@
+import contextvars
+import io
+import os
+import queue
+import sqlite3
+import threading
+from typing import List, Optional, Union
+from PIL import Image
+from utils import metrics
+from utils.catalog import ScreenshotCatalog
+from utils.logger import Logger
+
+FORMATS = {
+    "png": ("PNG", ".png"),
+    "webp": ("WEBP", ".webp"),
+    "jpeg": ("JPEG", ".jpg"),
+}
+
+
+class ScreenshotWriter:
+    """Capture -> encode -> write pipeline with a bounded queue and encoder workers
+
+    Captures are handed over as PIL images or already-encoded PNG bytes; encoding and
+    disk writes happen on the worker threads, and files are fsynced in batches.
+    Written files are indexed in `catalog` when one is given. PNG bytes are
+    written unchanged when `png_level` is None, otherwise re-encoded at that level.
+    """
+
+    def __init__(self, image_format: str = "png", png_level: Optional[int] = 6, quality: int = 85,
+                 workers: int = 2, queue_size: int = 16, fsync_every: int = 8,
+                 put_timeout: float = 1.0, catalog: Optional[ScreenshotCatalog] = None):
+        if image_format not in FORMATS:
+            raise ValueError(f"Unknown image format: {image_format}")
+        self.image_format = image_format
+        self.png_level = png_level
+        self.quality = quality
+        self.fsync_every = fsync_every
+        self.put_timeout = put_timeout
+        self.catalog = catalog
+        self.logger = Logger("ScreenshotWriter")
+
+        self.written = 0
+        self.dropped = 0
+        self.bytes_written = 0
+        self._pending_sync: List[str] = []
+        self._sync_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._workers = [
+            threading.Thread(target=self._worker, daemon=True, name=f"ScreenshotEncoder-{i + 1}")
+            for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    @property
+    def extension(self) -> str:
+        return FORMATS[self.image_format][1]
+
+    def submit(self, image: Union[Image.Image, bytes], base_path: str,
+               source: Optional[str] = None) -> Optional[str]:
+        """Queue a capture; returns the final file path, or None if the queue stayed full
+
+        `source` (window title, URL...) is stored with the capture in the catalog.
+        """
+        path = base_path + self.extension
+        try:
+            # The submitter's context keeps output and metrics attributed to its task
+            self._queue.put((contextvars.copy_context(), image, path, source), timeout=self.put_timeout)
+        except queue.Full:
+            with self._stats_lock:
+                self.dropped += 1
+            print(f"Screenshot dropped, writer queue full: {path}")
+            return None
+        return path
+
+    def _worker(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                context, image, path, source = item
+                context.run(self._process, image, path, source)
+            except Exception as e:
+                self.logger.error(f"Error writing screenshot: {str(e)}")
+                print(f"Error writing screenshot: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    def _process(self, image: Union[Image.Image, bytes], path: str, source: Optional[str]) -> None:
+        data = self._encode(image)
+        self._write(path, data)
+        metrics.artifact(path)
+        if self.catalog is not None:
+            self._index(image, data, path, source)
+        print(f"Screenshot saved: {path}")
+
+    def _index(self, image: Union[Image.Image, bytes], data: bytes, path: str, source: Optional[str]) -> None:
+        if isinstance(image, bytes):
+            # Only the header is parsed
+            with Image.open(io.BytesIO(image)) as header:
+                size = header.size
+        else:
+            size = image.size
+        task_metrics = metrics.current()
+        try:
+            self.catalog.add(path, data, size, task_metrics.feature if task_metrics else None, source)
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not index screenshot {path}: {str(e)}")
+
+    def _encode(self, image: Union[Image.Image, bytes]) -> bytes:
+        if isinstance(image, bytes):
+            if self.image_format == "png" and self.png_level is None:
+                return image
+            image = Image.open(io.BytesIO(image))
+
+        pil_format = FORMATS[self.image_format][0]
+        buffer = io.BytesIO()
+        if pil_format == "PNG":
+            image.save(buffer, pil_format, compress_level=self.png_level)
+        elif pil_format == "JPEG":
+            image.convert("RGB").save(buffer, pil_format, quality=self.quality)
+        else:
+            image.save(buffer, pil_format, quality=self.quality)
+        return buffer.getvalue()
+
+    def _write(self, path: str, data: bytes) -> None:
+        tmp_path = f"{path}.{threading.get_ident()}.part"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self._stats_lock:
+            self.written += 1
+            self.bytes_written += len(data)
+        with self._sync_lock:
+            self._pending_sync.append(path)
+            batch = None
+            if len(self._pending_sync) >= self.fsync_every:
+                batch, self._pending_sync = self._pending_sync, []
+        if batch:
+            self._fsync(batch)
+
+    def _fsync(self, paths: List[str]) -> None:
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDWR | getattr(os, "O_BINARY", 0))
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            except OSError as e:
+                self.logger.warning(f"fsync failed for {path}: {str(e)}")
+
+    def flush(self) -> None:
+        """Wait for queued captures and fsync everything written so far"""
+        self._queue.join()
+        with self._sync_lock:
+            batch, self._pending_sync = self._pending_sync, []
+        self._fsync(batch)
+
+    def close(self) -> None:
+        self.flush()
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            return {
+                "written": self.written,
+                "dropped": self.dropped,
+                "bytes_written": self.bytes_written,
+                "queued": self._queue.qsize(),
+            }
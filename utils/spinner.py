@@ -1,33 +1,31 @@
 import customtkinter as ctk
 from typing import Optional
-import threading
-import time
+from utils.animation import animation_clock
 
 class Spinner(ctk.CTkLabel):
     SPINNER_CHARS = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-    
-    def __init__(self, *args, **kwargs):
+
+    def __init__(self, *args, interval: float = 0.1, **kwargs):
+        kwargs.setdefault("font", ("Courier", 20))
         super().__init__(*args, **kwargs)
-        self.configure(text="", font=("Courier", 20))
+        self.configure(text="")
+        self.interval = interval
         self.running = False
-        self.thread: Optional[threading.Thread] = None
-        
+        self.idx = 0
+        self._animation: Optional[int] = None
+
     def start(self):
+        # Animated by the shared clock on the Tk thread, no thread per spinner
         if not self.running:
             self.running = True
-            self.thread = threading.Thread(target=self._animate)
-            self.thread.daemon = True
-            self.thread.start()
-            
+            self._animation = animation_clock.register(self, self._animate, self.interval)
+
     def stop(self):
         self.running = False
-        if self.thread:
-            self.thread.join()
+        animation_clock.unregister(self._animation)
+        self._animation = None
         self.configure(text="")
-            
+
     def _animate(self):
-        idx = 0
-        while self.running:
-            self.configure(text=self.SPINNER_CHARS[idx])
-            idx = (idx + 1) % len(self.SPINNER_CHARS)
-            time.sleep(0.1)
+        self.configure(text=self.SPINNER_CHARS[self.idx])
+        self.idx = (self.idx + 1) % len(self.SPINNER_CHARS)
@@ -0,0 +1,145 @@
+import importlib
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+from utils.logger import Logger
+
+# Imported by the main page but not needed to show the login page. qtawesome
+# is left out: IconCache only imports it (and PyQt5) on a disk cache miss
+HEAVY_MODULES = ["PIL.ImageTk", "pages.main_page"]
+
+
+def warm_modules(features_dir: str = "features") -> List[str]:
+    """Heavy modules plus every feature module (selenium, pyautogui, ...)"""
+    from utils.feature_registry import FeatureRegistry
+    registry = FeatureRegistry(features_dir)
+    modules = {f"{registry.package}.{feature.spec.module}" for feature in registry.discover()}
+    return HEAVY_MODULES + sorted(modules)
+
+
+class ImportWarmer:
+    """Imports modules in a background thread while the login page is shown
+
+    A module imported here is only bound to sys.modules once it is complete;
+    a main thread importing it meanwhile waits on the import lock for the
+    rest of it instead of starting over.
+    """
+
+    def __init__(self, features_dir: str = "features"):
+        self.features_dir = features_dir
+        self.timings: Dict[str, float] = {}
+        self.failed: Dict[str, str] = {}
+        self.logger = Logger("ImportWarmer")
+        self._done = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="import-warmer", daemon=True)
+            self._thread.start()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._done.wait(timeout)
+
+    def _run(self) -> None:
+        start = time.perf_counter()
+        try:
+            modules = warm_modules(self.features_dir)
+        except Exception as e:
+            self.logger.error(f"Feature discovery failed: {str(e)}")
+            modules = list(HEAVY_MODULES)
+        try:
+            for module in modules:
+                module_start = time.perf_counter()
+                try:
+                    importlib.import_module(module)
+                except Exception as e:
+                    # The failure surfaces again when the module is really used
+                    self.failed[module] = str(e)
+                    self.logger.warning(f"Could not preload {module}: {str(e)}")
+                    continue
+                self.timings[module] = time.perf_counter() - module_start
+            self.logger.info(f"Preloaded {len(self.timings)} modules in {time.perf_counter() - start:.2f}s")
+        finally:
+            self._done.set()
+
+
+_IMPORTTIME = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+_PHASE_MARKER = "startup-phase:warm"
+
+
+def profile_imports(features_dir: str = "features") -> Dict[str, List[dict]]:
+    """Import time per module of a cold start, split into boot and warm phases
+
+    Runs a fresh interpreter with -X importtime: `boot` is what main.py loads
+    before the login page, `warm` what the background warmer loads after it.
+    Times are in seconds; `cumulative` includes the module's own imports.
+    """
+    script = (
+        "import sys, importlib\n"
+        "import main\n"
+        f"sys.stderr.write({_PHASE_MARKER!r} + '\\n')\n"
+        "from utils.startup import warm_modules\n"
+        f"for module in warm_modules({features_dir!r}):\n"
+        "    try:\n"
+        "        importlib.import_module(module)\n"
+        "    except Exception as e:\n"
+        "        sys.stderr.write(f'import failed: {module}: {e}\\n')\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=root, capture_output=True, text=True
+    )
+    phases: Dict[str, List[dict]] = {"boot": [], "warm": [], "failed": []}
+    phase = "boot"
+    for line in result.stderr.splitlines():
+        if line == _PHASE_MARKER:
+            phase = "warm"
+            continue
+        if line.startswith("import failed: "):
+            phases["failed"].append({"module": line[len("import failed: "):]})
+            continue
+        match = _IMPORTTIME.match(line)
+        if match is None:
+            continue
+        own, cumulative, indent, module = match.groups()
+        phases[phase].append({
+            "module": module,
+            "self": int(own) / 1e6,
+            "cumulative": int(cumulative) / 1e6,
+            "depth": len(indent) // 2,
+        })
+    if result.returncode != 0:
+        raise RuntimeError(f"Startup profile failed: {result.stderr.strip().splitlines()[-1:]}")
+    return phases
+
+
+def report_startup_profile(top: int = 25, output: Optional[str] = None) -> None:
+    """Print the slowest imports of each startup phase, optionally saving them as JSON"""
+    phases = profile_imports()
+    for phase in ("boot", "warm"):
+        entries = phases[phase]
+        # Top-level entries are the imports made directly by the phase
+        total = sum(entry["cumulative"] for entry in entries if entry["depth"] == 0)
+        print(f"\n{phase} phase: {len(entries)} modules, {total * 1000:.1f} ms")
+        print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+        for entry in sorted(entries, key=lambda e: e["cumulative"], reverse=True)[:top]:
+            print(f"{entry['cumulative'] * 1000:14.1f} {entry['self'] * 1000:9.1f}  {entry['module']}")
+    for failure in phases["failed"]:
+        print(f"Import failed: {failure['module']}")
+
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump({"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": sys.version.split()[0],
+                       "phases": phases}, f, indent=2)
+        print(f"\nProfile written to {output}")
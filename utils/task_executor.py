@@ -0,0 +1,156 @@
+import heapq
+import itertools
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+from utils.logger import Logger
+
+
+@dataclass(order=True)
+class Job:
+    """A queued unit of work; ordered by priority (lower first), then submission order"""
+
+    priority: int
+    seq: int
+    task_id: int = field(compare=False)
+    feature: str = field(compare=False)
+    fn: Callable[[], None] = field(compare=False)
+    on_start: Optional[Callable[[], None]] = field(compare=False, default=None)
+    submitted_at: float = field(compare=False, default_factory=time.monotonic)
+    started_at: Optional[float] = field(compare=False, default=None)
+
+
+class TaskExecutor:
+    """Fixed worker pool with a global limit, per-feature limits and a priority run queue"""
+
+    def __init__(self, max_workers: int = 4, default_feature_limit: Optional[int] = None):
+        self.max_workers = max_workers
+        self.default_feature_limit = default_feature_limit
+        self.feature_limits: Dict[str, int] = {}
+        self.logger = Logger("TaskExecutor")
+
+        self._queue = []
+        self._seq = itertools.count()
+        self._running: Dict[str, int] = {}
+        self._cond = threading.Condition()
+        self._shutdown = False
+        self._workers = []
+
+        # Metrics
+        self.completed = 0
+        self.total_wait = 0.0
+        self.total_run = 0.0
+        self.max_wait = 0.0
+
+    def set_feature_limit(self, feature: str, limit: Optional[int]) -> None:
+        with self._cond:
+            if limit is None:
+                self.feature_limits.pop(feature, None)
+            else:
+                self.feature_limits[feature] = limit
+            self._cond.notify_all()
+
+    def submit(self, task_id: int, feature: str, fn: Callable[[], None],
+               priority: int = 0, on_start: Optional[Callable[[], None]] = None) -> Job:
+        job = Job(priority, next(self._seq), task_id, feature, fn, on_start)
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("Executor is shut down")
+            heapq.heappush(self._queue, job)
+            if len(self._workers) < self.max_workers:
+                worker = threading.Thread(target=self._worker, daemon=True,
+                                          name=f"TaskWorker-{len(self._workers) + 1}")
+                self._workers.append(worker)
+                worker.start()
+            self._cond.notify()
+        return job
+
+    def cancel(self, task_id: int) -> bool:
+        """Remove a queued job; returns False if it already started or is unknown"""
+        with self._cond:
+            for i, job in enumerate(self._queue):
+                if job.task_id == task_id:
+                    self._queue.pop(i)
+                    heapq.heapify(self._queue)
+                    return True
+        return False
+
+    def queue_position(self, task_id: int) -> Optional[int]:
+        with self._cond:
+            ordered = sorted(self._queue)
+        for i, job in enumerate(ordered):
+            if job.task_id == task_id:
+                return i + 1
+        return None
+
+    def _limit(self, feature: str) -> Optional[int]:
+        return self.feature_limits.get(feature, self.default_feature_limit)
+
+    def _next_runnable(self) -> Optional[Job]:
+        """Pop the best queued job whose feature is under its limit (caller holds the lock)"""
+        skipped = []
+        job = None
+        while self._queue:
+            candidate = heapq.heappop(self._queue)
+            limit = self._limit(candidate.feature)
+            if limit is None or self._running.get(candidate.feature, 0) < limit:
+                job = candidate
+                break
+            skipped.append(candidate)
+        for candidate in skipped:
+            heapq.heappush(self._queue, candidate)
+        return job
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                job = self._next_runnable()
+                while job is None:
+                    if self._shutdown:
+                        return
+                    self._cond.wait()
+                    job = self._next_runnable()
+                self._running[job.feature] = self._running.get(job.feature, 0) + 1
+
+            job.started_at = time.monotonic()
+            try:
+                if job.on_start:
+                    job.on_start()
+                job.fn()
+            except Exception as e:
+                self.logger.error(f"Task {job.task_id} raised: {str(e)}")
+            finally:
+                finished_at = time.monotonic()
+                with self._cond:
+                    self._running[job.feature] -= 1
+                    wait = job.started_at - job.submitted_at
+                    self.completed += 1
+                    self.total_wait += wait
+                    self.total_run += finished_at - job.started_at
+                    self.max_wait = max(self.max_wait, wait)
+                    self._cond.notify_all()
+                self.logger.info(
+                    f"Task {job.task_id} ({job.feature}) waited {wait:.2f}s, "
+                    f"ran {finished_at - job.started_at:.2f}s"
+                )
+
+    def stats(self) -> dict:
+        with self._cond:
+            completed = self.completed
+            return {
+                "queued": len(self._queue),
+                "running": sum(self._running.values()),
+                "workers": len(self._workers),
+                "completed": completed,
+                "avg_wait": self.total_wait / completed if completed else 0.0,
+                "max_wait": self.max_wait,
+                "avg_run": self.total_run / completed if completed else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        """Drop queued jobs and let workers exit once their current job finishes"""
+        with self._cond:
+            self._shutdown = True
+            self._queue.clear()
+            self._cond.notify_all()
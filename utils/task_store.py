@@ -0,0 +1,123 @@
+import itertools
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+ACTIVE_STATUSES = ("Queued", "Running", "Stopping")
+FAILED_STATUSES = ("Error", "Timed Out")
+
+
+@dataclass
+class TaskRecord:
+    """What the task list needs to know about one run"""
+
+    __slots__ = ("task_id", "feature", "icon", "status", "color", "stop_event", "metrics", "finished_at", "progress")
+
+    task_id: int
+    feature: str
+    icon: str
+    status: str
+    color: str
+    stop_event: Any
+    metrics: Any
+    finished_at: Optional[float]
+    progress: Any
+
+    @property
+    def active(self) -> bool:
+        return self.status in ACTIVE_STATUSES
+
+
+class TaskStore:
+    """Task records in creation order, pruning finished runs
+
+    Finished runs are kept while they are among the last `keep_last` ones and
+    younger than `keep_minutes`; active runs are never pruned. Counters are
+    cumulative, so they still count pruned runs.
+    """
+
+    def __init__(self, keep_last: int = 200, keep_minutes: float = 60):
+        self.keep_last = keep_last
+        self.keep_minutes = keep_minutes
+        self.records: "OrderedDict[int, TaskRecord]" = OrderedDict()
+        self._finished: Deque[int] = deque()  # in finishing order
+        self.total = 0
+        self.completed = 0
+        self.failed = 0
+        self.stopped = 0
+        self.version = 0  # Bumped when rows are added or removed
+
+    def __contains__(self, task_id: int) -> bool:
+        return task_id in self.records
+
+    def __getitem__(self, task_id: int) -> TaskRecord:
+        return self.records[task_id]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get(self, task_id: int) -> Optional[TaskRecord]:
+        return self.records.get(task_id)
+
+    def add(self, task_id: int, feature: str, icon: str, stop_event, status: str = "Queued",
+            color: str = "gray") -> TaskRecord:
+        record = TaskRecord(task_id, feature, icon, status, color, stop_event, None, None, None)
+        self.records[task_id] = record
+        self.total += 1
+        self.version += 1
+        return record
+
+    def set_status(self, task_id: int, status: str, color: str) -> Optional[TaskRecord]:
+        record = self.records.get(task_id)
+        if record is None or record.finished_at is not None:
+            return None
+        if record.status == "Stopping" and status in ACTIVE_STATUSES:
+            return None  # A late "Running" does not undo a stop request
+        record.status = status
+        record.color = color
+        if not record.active:
+            record.finished_at = time.monotonic()
+            self._finished.append(task_id)
+            if status == "Completed":
+                self.completed += 1
+            elif status in FAILED_STATUSES:
+                self.failed += 1
+            else:
+                self.stopped += 1
+        return record
+
+    @property
+    def running(self) -> int:
+        return len(self.records) - len(self._finished)
+
+    def active_ids(self) -> List[int]:
+        return [task_id for task_id, record in self.records.items() if record.finished_at is None]
+
+    def prune(self) -> int:
+        """Drop finished runs outside the retention policy; returns how many"""
+        cutoff = time.monotonic() - self.keep_minutes * 60
+        removed = 0
+        while self._finished:
+            task_id = self._finished[0]
+            if len(self._finished) <= self.keep_last and self.records[task_id].finished_at >= cutoff:
+                break
+            self._finished.popleft()
+            del self.records[task_id]
+            removed += 1
+        if removed:
+            self.version += 1
+        return removed
+
+    def rows(self, offset: int, count: int) -> List[TaskRecord]:
+        """Records for the visible rows, newest first"""
+        return list(itertools.islice(reversed(self.records.values()), offset, offset + count))
+
+    def counters(self) -> Dict[str, int]:
+        return {
+            "total": self.total,
+            "running": self.running,
+            "completed": self.completed,
+            "failed": self.failed,
+            "stopped": self.stopped,
+        }
@@ -1,13 +1,53 @@
 import customtkinter as ctk
 import sys
 from datetime import datetime
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging.handlers import QueueListener, RotatingFileHandler
+from typing import Dict, Optional
+import atexit
+import itertools
+import logging
+import os
 import queue
 import threading
+import time
+from utils.logger import CountingQueueHandler
+
+# Tâche dont le thread/contexte courant produit la sortie (None = sortie globale)
+_current_task: ContextVar[Optional[int]] = ContextVar("terminal_task", default=None)
+
+
+@contextmanager
+def task_output(task_id: int):
+    """Attribuer à la tâche tout ce que le contexte courant écrit sur stdout"""
+    token = _current_task.set(task_id)
+    try:
+        yield
+    finally:
+        _current_task.reset(token)
+
+
+def _task_tag(task_id: Optional[int]) -> str:
+    return "task-global" if task_id is None else f"task-{task_id}"
+
 
 class Terminal(ctk.CTkTextbox):
-    def __init__(self, *args, **kwargs):
+    def __init__(
+        self,
+        *args,
+        fps: int = 30,
+        max_lines_per_frame: int = 2000,
+        max_lines: int = 5000,
+        max_bytes: int = 2 * 1024 * 1024,
+        queue_size: int = 10000,
+        overflow: str = "drop_newest",
+        spill_path: str = "logs/terminal_scrollback.log",
+        **kwargs
+    ):
         super().__init__(*args, **kwargs)
-        
+
         # Configuration du terminal
         self.configure(
             font=("Courier", 12),
@@ -17,54 +57,256 @@ class Terminal(ctk.CTkTextbox):
             border_width=1,
             wrap="word"
         )
-        
-        # File d'attente pour les messages
-        self.queue = queue.Queue()
-        
-        # Démarrer le thread de traitement
+
+        # Un canal borné par tâche (alimenté depuis n'importe quel thread) :
+        # deque.append ne prend aucun verrou partagé entre les tâches
+        if overflow not in ("drop_newest", "drop_oldest"):
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self._channels: Dict[Optional[int], deque] = {None: deque(maxlen=queue_size)}
+        self._closed_channels = set()
+        self._seq = itertools.count()
+        self.dropped_lines = 0
+        self._dropped_pending = 0
+        self._drop_lock = threading.Lock()
+
+        # Historique borné : (lignes, octets, texte) par message affiché
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self._scrollback = deque()
+        self._scrollback_lines = 0
+        self._scrollback_bytes = 0
+        self.spilled_lines = 0
+        self._spill = self._create_spill_logger(spill_path)
+
+        # Lignes de chaque tâche encore dans l'historique (une entrée par tag), et filtre courant
+        self._tag_lines: Dict[Optional[int], int] = {}
+        self.filter_task: Optional[int] = None
+
+        # Rendu par image sur la boucle Tk
+        self.frame_interval = max(1, int(1000 / fps))
+        self.max_lines_per_frame = max_lines_per_frame
+        self.lines_rendered = 0
+        self._rate_window = deque()  # (instant, lignes) des dernières images
+        self._after_id = None
+
+        # Démarrer la boucle de rendu
         self.running = True
-        self.thread = threading.Thread(target=self._process_queue)
-        self.thread.daemon = True
-        self.thread.start()
-        
-    def _process_queue(self):
-        while self.running:
+        self._schedule_frame()
+
+    def _schedule_frame(self):
+        if self.running:
+            self._after_id = self.after(self.frame_interval, self._render_frame)
+
+    def _render_frame(self):
+        """Vider les canaux et insérer le lot en un seul bloc (thread principal)"""
+        lines = []
+        drained = []
+        for task_id, channel in list(self._channels.items()):
             try:
-                msg = self.queue.get(timeout=0.1)
-                self.write(msg)
-            except queue.Empty:
-                continue
-                
-    def write(self, text: str):
-        """Écrire dans le terminal avec timestamp"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+                while len(lines) < self.max_lines_per_frame:
+                    lines.append(channel.popleft())
+            except IndexError:
+                if task_id in self._closed_channels:
+                    del self._channels[task_id]
+                    self._closed_channels.discard(task_id)
+                    drained.append(task_id)
+        # Rétablir l'ordre chronologique entre les canaux
+        lines.sort()
+
+        with self._drop_lock:
+            dropped, self._dropped_pending = self._dropped_pending, 0
+        if dropped:
+            lines.append((next(self._seq), datetime.now().strftime("%H:%M:%S"), f"... {dropped} lines dropped ...", None))
+
+        if lines:
+            self._insert_block(lines)
+        for task_id in drained:
+            self._release_tag(task_id)
+        self._record_rate(len(lines))
+        self._schedule_frame()
+
+    def _insert_block(self, lines):
+        entries = [(f"[{ts}] {text}\n", task_id) for _, ts, text, task_id in lines]
         self.configure(state="normal")
-        self.insert("end", f"[{timestamp}] {text}\n")
+        # Un insert par suite de lignes d'une même tâche, chacune avec son tag
+        start = 0
+        for i in range(1, len(entries) + 1):
+            if i == len(entries) or entries[i][1] != entries[start][1]:
+                task_id = entries[start][1]
+                self._ensure_tag(task_id)
+                self.insert("end", "".join(entry for entry, _ in entries[start:i]), _task_tag(task_id))
+                start = i
+        for entry, task_id in entries:
+            size = len(entry.encode("utf-8"))
+            count = entry.count("\n")
+            self._scrollback.append((count, size, entry, task_id))
+            self._scrollback_lines += count
+            self._scrollback_bytes += size
+            self._tag_lines[task_id] += count
+        self._trim_scrollback()
         self.configure(state="disabled")
         self.see("end")
-        
+        self.lines_rendered += len(lines)
+
+    def _ensure_tag(self, task_id: Optional[int]):
+        if task_id not in self._tag_lines:
+            hidden = self.filter_task is not None and task_id != self.filter_task
+            self.tag_config(_task_tag(task_id), elide=hidden)
+            self._tag_lines[task_id] = 0
+
+    def _release_tag(self, task_id: Optional[int]):
+        """Supprimer le tag d'une tâche terminée dont plus aucune ligne n'est affichée"""
+        if task_id is not None and task_id not in self._channels and not self._tag_lines.get(task_id):
+            self._tag_lines.pop(task_id, None)
+            self.tag_delete(_task_tag(task_id))
+
+    def show_task(self, task_id: Optional[int]):
+        """Afficher la sortie d'une seule tâche (None = tout), via des tags masqués
+
+        Seules les tâches ayant encore des lignes à l'écran ont un tag : le coût
+        est borné par l'historique, pas par le nombre de tâches exécutées.
+        """
+        self.filter_task = task_id
+        for known in self._tag_lines:
+            hidden = task_id is not None and known != task_id
+            self.tag_config(_task_tag(known), elide=hidden)
+        self.see("end")
+
+    def close_channel(self, task_id: int):
+        """La tâche n'écrira plus : son canal sera retiré une fois vidé"""
+        self._closed_channels.add(task_id)
+
+    def _trim_scrollback(self):
+        """Supprimer les lignes les plus anciennes au-delà des limites"""
+        evicted = []
+        evicted_lines = 0
+        evicted_tasks = set()
+        while self._scrollback and (
+            self._scrollback_lines > self.max_lines
+            or self._scrollback_bytes > self.max_bytes
+        ):
+            count, size, entry, task_id = self._scrollback.popleft()
+            self._scrollback_lines -= count
+            self._scrollback_bytes -= size
+            self._tag_lines[task_id] -= count
+            evicted_lines += count
+            evicted.append(entry)
+            evicted_tasks.add(task_id)
+
+        if evicted:
+            self.delete("1.0", f"{evicted_lines + 1}.0")
+            for task_id in evicted_tasks:
+                self._release_tag(task_id)
+            self._spill.info("".join(evicted).rstrip("\n"))
+            self.spilled_lines += evicted_lines
+
+    @staticmethod
+    def _create_spill_logger(path: str) -> logging.Logger:
+        """Fichier rotatif recevant les lignes évincées de l'historique
+
+        L'écriture se fait dans un thread dédié : le thread Tk ne fait qu'enfiler.
+        """
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        spill = logging.getLogger(f"terminal.scrollback.{os.path.abspath(path)}")
+        spill.propagate = False
+        spill.setLevel(logging.INFO)
+        if not spill.handlers:
+            handler = RotatingFileHandler(path, maxBytes=10 * 1024 * 1024, backupCount=3, encoding="utf-8")
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            listener = QueueListener(queue.Queue(maxsize=10000), handler)
+            listener.start()
+            atexit.register(listener.stop)
+            spill.addHandler(CountingQueueHandler(listener.queue))
+        return spill
+
+    def _record_rate(self, count: int):
+        now = time.monotonic()
+        self._rate_window.append((now, count))
+        while self._rate_window and now - self._rate_window[0][0] > 1.0:
+            self._rate_window.popleft()
+
+    def put(self, text: str, task_id: Optional[int] = None):
+        """Ajouter un message depuis n'importe quel thread, sans jamais bloquer"""
+        channel = self._channels.get(task_id)
+        if channel is None:
+            channel = self._channels.setdefault(task_id, deque(maxlen=self.queue_size))
+        item = (next(self._seq), datetime.now().strftime("%H:%M:%S"), text, task_id)
+        if len(channel) >= self.queue_size:
+            self._count_dropped()
+            if self.overflow == "drop_newest":
+                return
+        # Avec drop_oldest, maxlen évince la plus ancienne ligne
+        channel.append(item)
+
+    def _count_dropped(self):
+        with self._drop_lock:
+            self.dropped_lines += 1
+            self._dropped_pending += 1
+
+    def write(self, text: str):
+        """Écrire dans le terminal avec timestamp (thread principal uniquement)"""
+        self._insert_block([(next(self._seq), datetime.now().strftime("%H:%M:%S"), text, None)])
+
+    def stats(self) -> dict:
+        """Lignes rendues par seconde et profondeur de la file"""
+        return {
+            "lines_per_sec": sum(count for _, count in self._rate_window),
+            "queue_depth": sum(len(channel) for channel in list(self._channels.values())),
+            "channels": len(self._channels),
+            "lines_rendered": self.lines_rendered,
+            "dropped_lines": self.dropped_lines,
+            "scrollback_lines": self._scrollback_lines,
+            "scrollback_bytes": self._scrollback_bytes,
+            "spilled_lines": self.spilled_lines,
+        }
+
     def clear(self):
         """Effacer le terminal"""
         self.configure(state="normal")
         self.delete("1.0", "end")
         self.configure(state="disabled")
-        
+        self._scrollback.clear()
+        self._scrollback_lines = 0
+        self._scrollback_bytes = 0
+        for task_id in list(self._tag_lines):
+            self._tag_lines[task_id] = 0
+            self._release_tag(task_id)
+
     def stop(self):
-        """Arrêter le thread de traitement"""
+        """Arrêter la boucle de rendu"""
         self.running = False
-        if self.thread.is_alive():
-            self.thread.join()
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
 
 class TerminalOutput:
-    """Classe pour rediriger stdout vers le terminal"""
-    def __init__(self, terminal: Terminal):
+    """Classe pour rediriger stdout vers le terminal, ligne par ligne vers le canal de la tâche courante"""
+    def __init__(self, terminal: Terminal, capture_lines: int = 1000):
         self.terminal = terminal
         self.stdout = sys.stdout
-        
+        self.capture_lines = capture_lines
+        self._captures: Dict[int, deque] = {}
+
     def write(self, text: str):
         if text.strip():  # Ignorer les lignes vides
-            self.terminal.queue.put(text.strip())
+            task_id = _current_task.get()
+            self.terminal.put(text.strip(), task_id)
+            capture = self._captures.get(task_id)
+            if capture is not None:
+                capture.append(text.strip())
         self.stdout.write(text)
-        
+
+    def start_capture(self, task_id: int):
+        """Conserver les dernières lignes écrites par une tâche, indépendamment du rendu"""
+        self._captures[task_id] = deque(maxlen=self.capture_lines)
+
+    def stop_capture(self, task_id: int) -> str:
+        capture = self._captures.pop(task_id, None)
+        return "\n".join(capture) if capture else ""
+
     def flush(self):
         self.stdout.flush()
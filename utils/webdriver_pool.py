@@ -0,0 +1,231 @@
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+from utils.cancellation import TaskCancelled, on_cancel
+from utils.logger import Logger
+
+
+@dataclass
+class PooledDriver:
+    driver: Any
+    uses: int = 0
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class WebDriverPool:
+    """Bounded pool of warm Firefox sessions, recycled after N uses or on error"""
+
+    def __init__(self, size: int = 2, headless: bool = False, max_uses: int = 20,
+                 idle_timeout: float = 300, prewarm: int = 1):
+        self.size = size
+        self.headless = headless
+        self.max_uses = max_uses
+        self.idle_timeout = idle_timeout
+        self.prewarm_count = prewarm
+        self.logger = Logger("WebDriverPool")
+
+        self._idle: List[PooledDriver] = []
+        self._total = 0  # idle + in use + starting
+        self._cond = threading.Condition()
+        self._closed = False
+        self._reaper: Optional[threading.Thread] = None
+
+    def configure(self, size: int, headless: bool, max_uses: int, idle_timeout: float, prewarm: int) -> None:
+        with self._cond:
+            self.size = size
+            self.headless = headless
+            self.max_uses = max_uses
+            self.idle_timeout = idle_timeout
+            self.prewarm_count = prewarm
+            self._closed = False
+            self._cond.notify_all()
+
+    def _create_driver(self):
+        from selenium import webdriver
+        from selenium.webdriver.firefox.options import Options
+
+        options = Options()
+        if self.headless:
+            options.add_argument("--headless")
+        return webdriver.Firefox(options=options)
+
+    def prewarm(self, count: Optional[int] = None) -> None:
+        """Start sessions in the background so the next acquire skips cold start"""
+        count = self.prewarm_count if count is None else count
+        with self._cond:
+            missing = min(count - len(self._idle), self.size - self._total)
+            if missing <= 0 or self._closed:
+                return
+            self._total += missing
+        for _ in range(missing):
+            threading.Thread(target=self._start_idle, daemon=True).start()
+        self._ensure_reaper()
+
+    def _start_idle(self):
+        try:
+            pooled = PooledDriver(self._create_driver())
+        except Exception as e:
+            self.logger.error(f"Could not start browser session: {str(e)}")
+            with self._cond:
+                self._total -= 1
+                self._cond.notify_all()
+            return
+        with self._cond:
+            if self._closed:
+                self._total -= 1
+                closed = True
+            else:
+                self._idle.append(pooled)
+                closed = False
+            self._cond.notify_all()
+        if closed:
+            self._quit(pooled)
+
+    def acquire(self, timeout: Optional[float] = None, stop_event=None) -> PooledDriver:
+        """Borrow a session, waiting for one if the pool is full
+
+        Raises TaskCancelled if `stop_event` is set before a session is available.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # A plain Event has no cancel callback to wake the wait: check it periodically
+        poll = None if stop_event is None or hasattr(stop_event, "on_cancel") else 0.5
+        with on_cancel(stop_event, self._wake):
+            return self._acquire(deadline, stop_event, poll)
+
+    def _acquire(self, deadline: Optional[float], stop_event, poll: Optional[float]) -> PooledDriver:
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("WebDriver pool is shut down")
+                    if stop_event is not None and stop_event.is_set():
+                        raise TaskCancelled(getattr(stop_event, "reason", None))
+                    if self._idle:
+                        pooled = self._idle.pop()
+                        break
+                    if self._total < self.size:
+                        self._total += 1
+                        pooled = None
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("No browser session available")
+                    if poll is not None:
+                        remaining = poll if remaining is None else min(remaining, poll)
+                    self._cond.wait(remaining)
+            if pooled is None:
+                break
+            # The health check is a WebDriver round-trip: run it outside the lock
+            if self._healthy(pooled):
+                return pooled
+            with self._cond:
+                self._total -= 1
+                self._cond.notify_all()
+            self._quit_later(pooled)
+
+        # Cold start outside the lock
+        try:
+            pooled = PooledDriver(self._create_driver())
+        except Exception:
+            with self._cond:
+                self._total -= 1
+                self._cond.notify_all()
+            raise
+        self._ensure_reaper()
+        return pooled
+
+    def _wake(self) -> None:
+        with self._cond:
+            self._cond.notify_all()
+
+    def release(self, pooled: PooledDriver, broken: bool = False) -> None:
+        pooled.uses += 1
+        pooled.last_used = time.monotonic()
+        recycle = broken or pooled.uses >= self.max_uses
+        with self._cond:
+            if recycle or self._closed:
+                self._total -= 1
+            else:
+                self._idle.append(pooled)
+            self._cond.notify_all()
+        if recycle or self._closed:
+            self._quit_later(pooled)
+
+    def interrupt(self, pooled: PooledDriver) -> None:
+        """Quit a session in use from another thread, without waiting for it
+
+        The pending command of its borrower fails; release it as broken.
+        """
+        self._quit_later(pooled)
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None, stop_event=None):
+        """Borrow a driver; any exception recycles the session"""
+        pooled = self.acquire(timeout, stop_event)
+        try:
+            yield pooled
+        except BaseException:
+            self.release(pooled, broken=True)
+            raise
+        else:
+            self.release(pooled)
+
+    @staticmethod
+    def _healthy(pooled: PooledDriver) -> bool:
+        try:
+            pooled.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _quit(self, pooled: PooledDriver) -> None:
+        try:
+            pooled.driver.quit()
+        except Exception as e:
+            self.logger.warning(f"Error closing browser session: {str(e)}")
+
+    def _quit_later(self, pooled: PooledDriver) -> None:
+        threading.Thread(target=self._quit, args=(pooled,), daemon=True).start()
+
+    def _ensure_reaper(self):
+        with self._cond:
+            if self._reaper is None or not self._reaper.is_alive():
+                self._reaper = threading.Thread(target=self._reap_idle, daemon=True)
+                self._reaper.start()
+
+    def _reap_idle(self):
+        """Close sessions idle for longer than idle_timeout"""
+        while True:
+            with self._cond:
+                self._cond.wait(max(1.0, self.idle_timeout / 2))
+                if self._closed:
+                    return
+                now = time.monotonic()
+                expired = [p for p in self._idle if now - p.last_used > self.idle_timeout]
+                for pooled in expired:
+                    self._idle.remove(pooled)
+                    self._total -= 1
+                if expired:
+                    self._cond.notify_all()
+            for pooled in expired:
+                self._quit(pooled)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {"idle": len(self._idle), "total": self._total, "size": self.size}
+
+    def shutdown(self) -> None:
+        """Quit idle sessions; sessions in use are quit when released"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+            self._cond.notify_all()
+        for pooled in idle:
+            self._quit(pooled)
+
+
+firefox_pool = WebDriverPool()
@@ -0,0 +1,77 @@
+import threading
+import tkinter as tk
+from typing import Callable, List, Optional
+from utils.animation import animation_clock
+from utils.logger import Logger
+
+
+class WindowPoller:
+    """Enumerates windows off the Tk main thread and pushes only changes to the UI
+
+    The owner widget's visibility is sampled on the Tk thread to switch between
+    the normal and the back-off interval, and <Destroy> stops the poller.
+    <Map>/<Unmap> are not enough: Tk does not send them to child widgets when
+    the toplevel is iconified, and CTkFrame.bind() targets its inner canvas.
+    """
+
+    def __init__(self, widget, fetch: Callable[[], List[str]], on_change: Callable[[List[str]], None],
+                 interval: float = 1.0, hidden_interval: float = 10.0):
+        self.widget = widget
+        self.fetch = fetch
+        self.on_change = on_change
+        self.interval = interval
+        self.hidden_interval = hidden_interval
+        self.logger = Logger("WindowPoller")
+
+        self.visible = True
+        self._last: Optional[tuple] = None
+        self._stop_event = threading.Event()
+        self._wake = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="WindowPoller")
+
+        self._visibility_check: Optional[int] = None
+        widget.bind("<Destroy>", self._on_destroy)
+
+    def start(self) -> None:
+        self._thread.start()
+        self._visibility_check = animation_clock.register(self.widget, self._check_visibility, self.interval)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._wake.set()
+        animation_clock.unregister(self._visibility_check)
+        self._visibility_check = None
+
+    def _check_visibility(self):
+        # Viewable only if the widget and all its ancestors, toplevel included, are mapped
+        visible = bool(self.widget.winfo_viewable())
+        if visible and not self.visible:
+            # Refresh right away when the panel becomes visible again
+            self._wake.set()
+        self.visible = visible
+
+    def _on_destroy(self, _event=None):
+        self.stop()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                windows = self.fetch()
+            except Exception as e:
+                self.logger.warning(f"Window enumeration failed: {str(e)}")
+                windows = None
+
+            if windows is not None and tuple(windows) != self._last:
+                self._last = tuple(windows)
+                try:
+                    self.widget.after(0, self._apply, list(windows))
+                except (RuntimeError, tk.TclError):
+                    # The widget or Tk itself is gone
+                    return
+
+            self._wake.wait(self.interval if self.visible else self.hidden_interval)
+            self._wake.clear()
+
+    def _apply(self, windows: List[str]):
+        if not self._stop_event.is_set():
+            self.on_change(windows)